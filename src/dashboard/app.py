@@ -4,16 +4,18 @@ Streamlit dashboard for the price tracker system.
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
+import pyarrow as pa
 from datetime import datetime, timedelta
 import json
 import asyncio
 from pathlib import Path
 import sys
 
-# Add src to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
+# Add the project root for imports (once; reruns reuse the cached entry)
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.database.models import DatabaseManager
 from src.utils.export_manager import ExportManager
@@ -29,24 +31,40 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize components
+# Initialize components. Each one is a lazy cache_resource singleton so a
+# session only pays for the components its pages actually use.
+SETTINGS = {
+    'export_path': 'exports/',
+    'log_level': 'INFO',
+    'log_file': 'logs/dashboard.log'
+}
+
+@st.cache_resource
+def get_db_manager():
+    """Shared DatabaseManager singleton."""
+    return DatabaseManager()
+
+@st.cache_resource
+def get_export_manager():
+    """ExportManager, built only when the Export page needs it."""
+    return ExportManager(get_db_manager(), SETTINGS)
+
+@st.cache_resource
+def get_health_monitor():
+    """HealthMonitor singleton."""
+    return HealthMonitor(get_db_manager(), SETTINGS)
+
+@st.cache_resource
+def get_quality_checker():
+    """DataQualityChecker, built only for System Control."""
+    return DataQualityChecker(get_db_manager())
+
 @st.cache_resource
-def init_components():
-    """Initialize database and utility components."""
-    db_manager = DatabaseManager()
-    settings = {
-        'export_path': 'exports/',
-        'log_level': 'INFO',
-        'log_file': 'logs/dashboard.log'
-    }
-    export_manager = ExportManager(db_manager, settings)
-    health_monitor = HealthMonitor(db_manager, settings)
-    quality_checker = DataQualityChecker(db_manager)
-    scheduler = PriceTrackerScheduler()
-    
-    return db_manager, export_manager, health_monitor, quality_checker, scheduler
-
-db_manager, export_manager, health_monitor, quality_checker, scheduler = init_components()
+def get_scheduler():
+    """PriceTrackerScheduler, built only for System Control."""
+    return PriceTrackerScheduler()
+
+db_manager = get_db_manager()
 
 # Sidebar
 st.sidebar.title("🏥 Price Tracker")
@@ -64,10 +82,143 @@ def load_latest_prices(days=7):
     """Load latest price data."""
     return db_manager.get_latest_prices(days)
 
+@st.cache_data(ttl=300)
+def load_latest_price_columns(days=7):
+    """Load latest price data as column arrays for cheap frame assembly."""
+    return db_manager.get_latest_prices_columnar(days)
+
 @st.cache_data(ttl=300)
 def load_health_data():
     """Load system health data."""
-    return health_monitor.get_system_health()
+    return get_health_monitor().get_system_health()
+
+@st.cache_data(ttl=60)
+def load_top_metrics():
+    """Load the Dashboard headline counts in a single round-trip."""
+    with db_manager.get_connection() as conn:
+        row = conn.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM sku_config WHERE active = 1),
+                (SELECT COUNT(*) FROM retailer_config WHERE active = 1),
+                (SELECT COUNT(*) FROM price_history
+                 WHERE scraped_at >= datetime('now', '-1 day'))
+        """).fetchone()
+    return tuple(row)
+
+@st.cache_data(ttl=300)
+def load_quick_stats(days):
+    """Average price, in-stock share and distinct products for the period."""
+    with db_manager.get_connection() as conn:
+        row = conn.execute("""
+            SELECT AVG(ph.price),
+                   100.0 * AVG(ph.in_stock),
+                   COUNT(DISTINCT sc.product_name)
+            FROM price_history ph
+            JOIN sku_config sc ON ph.sku_id = sc.id
+            WHERE ph.scraped_at >= datetime('now', ?)
+        """, ('-{} days'.format(days),)).fetchone()
+    return tuple(row)
+
+@st.cache_data(ttl=300)
+def price_table_arrow(days):
+    """Recent-price display table as a ready-made Arrow table.
+
+    The price column stays numeric; display formatting is applied by
+    st.column_config at render time so the grid sorts numerically.
+    """
+    df = _to_frame(load_latest_price_columns(days))
+    display_columns = ['brand', 'product_name', 'pack_size', 'retailer_name',
+                       'price', 'in_stock', 'scraped_at']
+    return pa.Table.from_pandas(df[display_columns], preserve_index=False)
+
+PRICE_TABLE_COLUMNS = {
+    'brand': st.column_config.TextColumn('Brand'),
+    'product_name': st.column_config.TextColumn('Product'),
+    'pack_size': st.column_config.TextColumn('Pack Size'),
+    'retailer_name': st.column_config.TextColumn('Retailer'),
+    'price': st.column_config.NumberColumn('Price', format='£%.2f'),
+    'in_stock': st.column_config.CheckboxColumn('In Stock'),
+    'scraped_at': st.column_config.DatetimeColumn('Last Updated'),
+}
+
+@st.cache_data(ttl=600)
+def brand_options():
+    """Distinct active brands for the filter sidebar."""
+    return sorted({sku['brand'] for sku in db_manager.get_active_skus()})
+
+@st.cache_data(ttl=600)
+def retailer_options():
+    """Distinct active retailer names for the filter sidebar."""
+    return sorted(retailer['name'] for retailer in db_manager.get_active_retailers())
+
+@st.cache_data(ttl=600)
+def product_options():
+    """Distinct product display names for the Trends selector."""
+    with db_manager.get_connection() as conn:
+        return [f"{brand} - {product_name}" for brand, product_name in conn.execute(
+            "SELECT DISTINCT brand, product_name FROM sku_config WHERE active = 1"
+        )]
+
+def _history_cutoff(days=90):
+    """ISO cutoff timestamp bound as a plain parameter.
+
+    A `scraped_at >= ?` predicate lets SQLite seek the scraped_at index
+    instead of evaluating datetime('now', ...) while scanning.
+    """
+    return (datetime.utcnow() - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+
+@st.cache_data(ttl=600)  # Trends change slowly; cache for 10 minutes
+def load_product_trend(brand, product_name):
+    """Load the daily mean price series for a single product."""
+    with db_manager.get_connection() as conn:
+        query = """
+            SELECT
+                spd.day as date,
+                rc.name as retailer_name,
+                spd.price
+            FROM sku_price_daily spd
+            JOIN sku_config sc ON spd.sku_id = sc.id
+            JOIN retailer_config rc ON spd.retailer_id = rc.id
+            WHERE spd.day >= date(?)
+            AND spd.price IS NOT NULL
+            AND sc.brand = ? AND sc.product_name = ?
+            ORDER BY spd.day
+        """
+        # Stream in chunks so cold loads never buffer the whole result twice
+        chunks = list(pd.read_sql_query(
+            query, conn, params=(_history_cutoff(), brand, product_name),
+            chunksize=10_000
+        ))
+    if not chunks:
+        return pd.DataFrame(columns=['date', 'retailer_name', 'price'])
+    return pd.concat(chunks, ignore_index=True)
+
+@st.cache_data(ttl=300)
+def load_price_matrix(days, brands, retailers):
+    """Load mean price per SKU/retailer with min/max across retailers in SQL."""
+    brand_placeholders = ','.join('?' * len(brands))
+    retailer_placeholders = ','.join('?' * len(retailers))
+    query = """
+        SELECT
+            sc.brand,
+            sc.product_name,
+            sc.pack_size,
+            rc.name as retailer_name,
+            AVG(ph.price) as price,
+            MIN(AVG(ph.price)) OVER (PARTITION BY sc.id) as min_price,
+            MAX(AVG(ph.price)) OVER (PARTITION BY sc.id) as max_price
+        FROM price_history ph
+        JOIN sku_config sc ON ph.sku_id = sc.id
+        JOIN retailer_config rc ON ph.retailer_id = rc.id
+        WHERE ph.scraped_at >= datetime('now', ?)
+        AND ph.price IS NOT NULL
+        AND sc.brand IN ({})
+        AND rc.name IN ({})
+        GROUP BY sc.id, rc.id
+    """.format(brand_placeholders, retailer_placeholders)
+    with db_manager.get_connection() as conn:
+        return pd.read_sql_query(query, conn,
+                                 params=('-{} days'.format(days), *brands, *retailers))
 
 def format_currency(value):
     """Format currency values."""
@@ -75,28 +226,74 @@ def format_currency(value):
         return "N/A"
     return f"£{value:.2f}"
 
+def _to_frame(rows):
+    """Build a DataFrame from price rows, storing repeated strings as category."""
+    df = pd.DataFrame(rows)
+    for col in ('brand', 'product_name', 'pack_size', 'retailer_name'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+def format_currency_series(prices: pd.Series) -> pd.Series:
+    """Vectorized currency formatting for a whole price column."""
+    return prices.map("£{:.2f}".format).where(prices.notna(), "N/A")
+
+def downsample_lttb(x, y, n_out=1000):
+    """Downsample a line series with Largest-Triangle-Three-Buckets.
+
+    Keeps the visually significant points so the front end never receives
+    more than ~n_out points per trace, however long the history grows.
+    """
+    n = len(y)
+    if n <= n_out:
+        return x, y
+
+    y = np.asarray(y, dtype=float)
+    every = (n - 2) / (n_out - 2)
+    selected = [0]
+    anchor = 0
+    for i in range(n_out - 2):
+        bucket_start = int(i * every) + 1
+        bucket_end = int((i + 1) * every) + 1
+        next_start = bucket_end
+        next_end = min(int((i + 2) * every) + 1, n)
+
+        # Average point of the following bucket (uses sample position as x)
+        avg_x = (next_start + next_end - 1) / 2
+        avg_y = y[next_start:next_end].mean()
+
+        # Pick the point forming the largest triangle with anchor and average
+        candidates = np.arange(bucket_start, bucket_end)
+        areas = np.abs(
+            (anchor - avg_x) * (y[bucket_start:bucket_end] - y[anchor])
+            - (anchor - candidates) * (avg_y - y[anchor])
+        )
+        anchor = bucket_start + int(np.argmax(areas))
+        selected.append(anchor)
+    selected.append(n - 1)
+
+    return x[selected], y[selected]
+
 # Main content based on selected page
 if page == "📊 Dashboard":
     st.title("📊 Price Tracker Dashboard")
     
-    # Key metrics
+    # Key metrics (counts come back as one row from a single query)
+    sku_count, retailer_count, prices_today = load_top_metrics()
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         # Total SKUs
-        skus = db_manager.get_active_skus()
-        st.metric("Active SKUs", len(skus))
-    
+        st.metric("Active SKUs", sku_count)
+
     with col2:
         # Total Retailers
-        retailers = db_manager.get_active_retailers()
-        st.metric("Active Retailers", len(retailers))
-    
+        st.metric("Active Retailers", retailer_count)
+
     with col3:
         # Latest prices count
-        latest_prices = load_latest_prices(1)
-        st.metric("Prices Today", len(latest_prices))
-    
+        st.metric("Prices Today", prices_today)
+
     with col4:
         # System health
         health = load_health_data()
@@ -110,76 +307,65 @@ if page == "📊 Dashboard":
     
     st.markdown("---")
     
-    # Recent price data
-    st.subheader("📋 Recent Price Data")
-    
-    # Date filter
-    col1, col2 = st.columns([1, 3])
-    with col1:
-        days_filter = st.selectbox("Show data from last:", [1, 3, 7, 14, 30], index=2)
-    
-    # Load and display data
-    price_data = load_latest_prices(days_filter)
-    
-    if price_data:
-        df = pd.DataFrame(price_data)
-        df['scraped_at'] = pd.to_datetime(df['scraped_at'])
-        df['price_formatted'] = df['price'].apply(format_currency)
-        
-        # Display table
-        display_columns = ['brand', 'product_name', 'pack_size', 'retailer_name', 
-                          'price_formatted', 'in_stock', 'scraped_at']
-        
-        st.dataframe(
-            df[display_columns].rename(columns={
-                'brand': 'Brand',
-                'product_name': 'Product',
-                'pack_size': 'Pack Size',
-                'retailer_name': 'Retailer',
-                'price_formatted': 'Price',
-                'in_stock': 'In Stock',
-                'scraped_at': 'Last Updated'
-            }),
-            use_container_width=True,
-            hide_index=True
-        )
-        
-        # Quick stats
-        col1, col2, col3 = st.columns(3)
+    # Recent price data. Run as a fragment so changing the day filter only
+    # re-renders this block, not the four metric queries above.
+    @st.fragment
+    def recent_price_data_block():
+        st.subheader("📋 Recent Price Data")
+
+        # Date filter
+        col1, col2 = st.columns([1, 3])
         with col1:
-            avg_price = df['price'].mean()
-            st.metric("Average Price", format_currency(avg_price))
-        with col2:
-            in_stock_pct = (df['in_stock'].sum() / len(df)) * 100
-            st.metric("In Stock %", f"{in_stock_pct:.1f}%")
-        with col3:
-            unique_products = df['product_name'].nunique()
-            st.metric("Unique Products", unique_products)
-    else:
-        st.info("No price data available for the selected period.")
+            days_filter = st.selectbox("Show data from last:", [1, 3, 7, 14, 30], index=2)
+
+        # Load and display data
+        price_data = load_latest_price_columns(days_filter)
+
+        if price_data:
+            # Display table (pre-converted to Arrow and cached, so the
+            # pandas -> Arrow serialization does not repeat every rerun)
+            st.dataframe(
+                price_table_arrow(days_filter),
+                use_container_width=True,
+                hide_index=True,
+                column_config=PRICE_TABLE_COLUMNS
+            )
+
+            # Quick stats (one cached SQL pass, no frame reductions)
+            avg_price, in_stock_pct, unique_products = load_quick_stats(days_filter)
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Average Price", format_currency(avg_price))
+            with col2:
+                st.metric("In Stock %", f"{(in_stock_pct or 0):.1f}%")
+            with col3:
+                st.metric("Unique Products", unique_products)
+        else:
+            st.info("No price data available for the selected period.")
+
+    recent_price_data_block()
 
 elif page == "💰 Price Analysis":
     st.title("💰 Price Analysis")
     
     # Load data
-    price_data = load_latest_prices(30)
+    price_data = load_latest_price_columns(30)
     
     if not price_data:
         st.warning("No price data available for analysis.")
         st.stop()
     
-    df = pd.DataFrame(price_data)
-    df['scraped_at'] = pd.to_datetime(df['scraped_at'])
+    df = _to_frame(price_data)
     
     # Filters
     st.sidebar.subheader("Filters")
     
-    # Brand filter
-    brands = sorted(df['brand'].unique())
+    # Brand filter (options come from cached config queries, not a frame scan)
+    brands = brand_options()
     selected_brands = st.sidebar.multiselect("Select Brands:", brands, default=brands[:3])
-    
+
     # Retailer filter
-    retailers = sorted(df['retailer_name'].unique())
+    retailers = retailer_options()
     selected_retailers = st.sidebar.multiselect("Select Retailers:", retailers, default=retailers)
     
     # Filter data
@@ -192,108 +378,113 @@ elif page == "💰 Price Analysis":
         st.warning("No data matches the selected filters.")
         st.stop()
     
-    # Price comparison chart
+    # Price comparison chart. Five-number summaries are computed here so
+    # the browser receives one box per (brand, retailer) group instead of
+    # every raw price point as SVG nodes.
     st.subheader("📊 Price Comparison by Brand")
-    
-    fig = px.box(
-        filtered_df, 
-        x='brand', 
-        y='price', 
-        color='retailer_name',
-        title="Price Distribution by Brand and Retailer"
+
+    box_stats = filtered_df.groupby(['retailer_name', 'brand'], observed=True)['price'].describe(
+        percentiles=[.25, .5, .75]
+    )
+    # Imported here so chart-free pages skip the plotly import cost
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    for retailer, retailer_stats in box_stats.groupby(level='retailer_name', observed=True):
+        rows = retailer_stats.droplevel('retailer_name')
+        fig.add_trace(go.Box(
+            name=retailer,
+            x=rows.index.tolist(),
+            q1=rows['25%'],
+            median=rows['50%'],
+            q3=rows['75%'],
+            lowerfence=rows['min'],
+            upperfence=rows['max'],
+            boxpoints=False
+        ))
+    fig.update_layout(
+        title="Price Distribution by Brand and Retailer",
+        boxmode='group',
+        height=500
     )
-    fig.update_layout(height=500)
     st.plotly_chart(fig, use_container_width=True)
     
-    # Price comparison table
+    # Price comparison table (aggregation and min/max pushed into SQL)
     st.subheader("📋 Price Comparison Table")
-    
-    # Create pivot table
-    pivot_df = filtered_df.pivot_table(
+
+    matrix_df = load_price_matrix(30, selected_brands, selected_retailers)
+
+    # Pivot only reshapes the already-aggregated rows for display
+    pivot_df = matrix_df.pivot(
         index=['brand', 'product_name', 'pack_size'],
         columns='retailer_name',
-        values='price',
-        aggfunc='mean'
+        values='price'
     ).round(2)
-    
-    # Add statistics
-    pivot_df['Min Price'] = pivot_df.min(axis=1)
-    pivot_df['Max Price'] = pivot_df.max(axis=1)
+
+    # Min/max come attached from the SQL window functions
+    sku_stats = matrix_df.drop_duplicates(['brand', 'product_name', 'pack_size']).set_index(
+        ['brand', 'product_name', 'pack_size']
+    )
+    pivot_df['Min Price'] = sku_stats['min_price'].round(2)
+    pivot_df['Max Price'] = sku_stats['max_price'].round(2)
     pivot_df['Price Range'] = (pivot_df['Max Price'] - pivot_df['Min Price']).round(2)
-    
+
     st.dataframe(pivot_df, use_container_width=True)
     
-    # Cheapest/Most expensive
+    # Cheapest/Most expensive — one groupby pass over categorical keys
+    filtered_df[['brand', 'product_name']] = filtered_df[['brand', 'product_name']].astype('category')
+    extrema_idx = filtered_df.groupby(['brand', 'product_name'], observed=True)['price'].agg(['idxmin', 'idxmax'])
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         st.subheader("💚 Cheapest Options")
-        cheapest = filtered_df.loc[filtered_df.groupby(['brand', 'product_name'])['price'].idxmin()]
+        cheapest = filtered_df.loc[extrema_idx['idxmin']]
         cheapest_display = cheapest[['brand', 'product_name', 'retailer_name', 'price']].copy()
-        cheapest_display['price'] = cheapest_display['price'].apply(format_currency)
+        cheapest_display['price'] = format_currency_series(cheapest_display['price'])
         st.dataframe(cheapest_display, hide_index=True)
-    
+
     with col2:
         st.subheader("💸 Most Expensive Options")
-        expensive = filtered_df.loc[filtered_df.groupby(['brand', 'product_name'])['price'].idxmax()]
+        expensive = filtered_df.loc[extrema_idx['idxmax']]
         expensive_display = expensive[['brand', 'product_name', 'retailer_name', 'price']].copy()
-        expensive_display['price'] = expensive_display['price'].apply(format_currency)
+        expensive_display['price'] = format_currency_series(expensive_display['price'])
         st.dataframe(expensive_display, hide_index=True)
 
 elif page == "📈 Trends":
     st.title("📈 Price Trends")
     
-    # Load historical data
-    with db_manager.get_connection() as conn:
-        query = """
-            SELECT 
-                ph.*,
-                sc.brand,
-                sc.product_name,
-                sc.pack_size,
-                rc.name as retailer_name
-            FROM price_history ph
-            JOIN sku_config sc ON ph.sku_id = sc.id
-            JOIN retailer_config rc ON ph.retailer_id = rc.id
-            WHERE ph.scraped_at >= datetime('now', '-90 days')
-            AND ph.price IS NOT NULL
-            ORDER BY ph.scraped_at
-        """
-        df = pd.read_sql_query(query, conn)
-    
-    if df.empty:
-        st.warning("No historical data available for trend analysis.")
-        st.stop()
-    
-    df['scraped_at'] = pd.to_datetime(df['scraped_at'])
-    df['date'] = df['scraped_at'].dt.date
-    
-    # Product selector
-    products = df.groupby(['brand', 'product_name']).size().reset_index()
-    products['display_name'] = products['brand'] + ' - ' + products['product_name']
-    
+    # Product selector (cached DISTINCT over sku_config, no groupby scan).
+    # The 90-day pull is deferred until a product is chosen so only that
+    # product's series is ever read.
     selected_product = st.selectbox(
         "Select Product for Trend Analysis:",
-        products['display_name'].tolist()
+        product_options()
     )
-    
+
     if selected_product:
         brand, product_name = selected_product.split(' - ', 1)
-        product_df = df[(df['brand'] == brand) & (df['product_name'] == product_name)]
-        
-        # Daily average prices
-        daily_prices = product_df.groupby(['date', 'retailer_name'])['price'].mean().reset_index()
-        
-        # Line chart
-        fig = px.line(
-            daily_prices,
-            x='date',
-            y='price',
-            color='retailer_name',
+        product_df = load_product_trend(brand, product_name)
+
+        if product_df.empty:
+            st.warning("No historical data available for trend analysis.")
+            st.stop()
+
+        # Rows are already daily means per retailer from the SQL aggregation
+        daily_prices = product_df
+
+        # Line chart: WebGL traces, LTTB-downsampled per retailer so the
+        # browser payload stays bounded as history grows
+        import plotly.graph_objects as go
+        fig = go.Figure()
+        for retailer, sub in daily_prices.groupby('retailer_name'):
+            x, y = downsample_lttb(sub['date'].to_numpy(), sub['price'].to_numpy())
+            fig.add_trace(go.Scattergl(x=x, y=y, mode='lines', name=retailer))
+        fig.update_layout(
             title=f"Price Trend: {selected_product}",
-            labels={'price': 'Price (£)', 'date': 'Date'}
+            xaxis_title='Date',
+            yaxis_title='Price (£)',
+            height=500
         )
-        fig.update_layout(height=500)
         st.plotly_chart(fig, use_container_width=True)
         
         # Statistics
@@ -313,81 +504,89 @@ elif page == "📈 Trends":
 
 elif page == "🔍 Health Monitor":
     st.title("🔍 System Health Monitor")
+
+    # The whole page body runs as a fragment so the refresh button only
+    # re-executes this block instead of the full script.
+    @st.fragment
+    def health_monitor_block():
+    
+        # Get health data
+        health_data = load_health_data()
+    
+        # Overall status
+        status = health_data.get('overall_status', 'unknown')
+        status_color = {
+            'healthy': '🟢',
+            'degraded': '🟡', 
+            'unhealthy': '🔴'
+        }.get(status, '⚪')
+    
+        st.subheader(f"{status_color} System Status: {status.title()}")
+    
+        # Issues
+        issues = health_data.get('issues', [])
+        if issues:
+            st.subheader("⚠️ Current Issues")
+            for issue in issues:
+                st.error(issue)
+        else:
+            st.success("No issues detected")
     
-    # Get health data
-    health_data = load_health_data()
-    
-    # Overall status
-    status = health_data.get('overall_status', 'unknown')
-    status_color = {
-        'healthy': '🟢',
-        'degraded': '🟡', 
-        'unhealthy': '🔴'
-    }.get(status, '⚪')
-    
-    st.subheader(f"{status_color} System Status: {status.title()}")
-    
-    # Issues
-    issues = health_data.get('issues', [])
-    if issues:
-        st.subheader("⚠️ Current Issues")
-        for issue in issues:
-            st.error(issue)
-    else:
-        st.success("No issues detected")
-    
-    # Metrics
-    metrics = health_data.get('metrics', {})
+        # Metrics
+        metrics = health_data.get('metrics', {})
     
-    # Scrape health
-    if 'scrape_health' in metrics:
-        scrape_health = metrics['scrape_health']
-        st.subheader("🔄 Scraping Health")
+        # Scrape health
+        if 'scrape_health' in metrics:
+            scrape_health = metrics['scrape_health']
+            st.subheader("🔄 Scraping Health")
         
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Success Rate", f"{scrape_health.get('success_rate', 0)}%")
-        with col2:
-            st.metric("Total Attempts", scrape_health.get('total_attempts', 0))
-        with col3:
-            st.metric("Successful", scrape_health.get('successful_attempts', 0))
-        with col4:
-            st.metric("Avg Response Time", f"{scrape_health.get('average_response_time', 0):.2f}s")
-    
-    # Data freshness
-    if 'data_freshness' in metrics:
-        freshness = metrics['data_freshness']
-        st.subheader("📅 Data Freshness")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Success Rate", f"{scrape_health.get('success_rate', 0)}%")
+            with col2:
+                st.metric("Total Attempts", scrape_health.get('total_attempts', 0))
+            with col3:
+                st.metric("Successful", scrape_health.get('successful_attempts', 0))
+            with col4:
+                st.metric("Avg Response Time", f"{scrape_health.get('average_response_time', 0):.2f}s")
+    
+        # Data freshness
+        if 'data_freshness' in metrics:
+            freshness = metrics['data_freshness']
+            st.subheader("📅 Data Freshness")
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Fresh Data", f"{freshness.get('fresh_data_count', 0)}/{freshness.get('total_sku_retailer_pairs', 0)}")
-        with col2:
-            st.metric("Stale Percentage", f"{freshness.get('stale_percentage', 0)}%")
-        with col3:
-            st.metric("Oldest Data", f"{freshness.get('oldest_data_age_hours', 0):.1f}h")
-    
-    # Database health
-    if 'database' in metrics:
-        db_health = metrics['database']
-        st.subheader("💾 Database Health")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Fresh Data", f"{freshness.get('fresh_data_count', 0)}/{freshness.get('total_sku_retailer_pairs', 0)}")
+            with col2:
+                st.metric("Stale Percentage", f"{freshness.get('stale_percentage', 0)}%")
+            with col3:
+                st.metric("Oldest Data", f"{freshness.get('oldest_data_age_hours', 0):.1f}h")
+    
+        # Database health
+        if 'database' in metrics:
+            db_health = metrics['database']
+            st.subheader("💾 Database Health")
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            accessible = "✅" if db_health.get('accessible') else "❌"
-            st.metric("Accessible", accessible)
-        with col2:
-            st.metric("Total Records", db_health.get('total_records', 0))
-        with col3:
-            st.metric("DB Size", f"{db_health.get('database_size_mb', 0)} MB")
-    
-    # Refresh button
-    if st.button("🔄 Refresh Health Data"):
-        st.cache_data.clear()
-        st.rerun()
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                accessible = "✅" if db_health.get('accessible') else "❌"
+                st.metric("Accessible", accessible)
+            with col2:
+                st.metric("Total Records", db_health.get('total_records', 0))
+            with col3:
+                st.metric("DB Size", f"{db_health.get('database_size_mb', 0)} MB")
+    
+        # Refresh button
+        if st.button("🔄 Refresh Health Data"):
+            st.cache_data.clear()
+            st.rerun(scope="fragment")
+
+    health_monitor_block()
 
 elif page == "📤 Export Data":
     st.title("📤 Export Data")
+    export_manager = get_export_manager()
     
     # Export options
     st.subheader("📊 Export Options")
@@ -428,15 +627,20 @@ elif page == "📤 Export Data":
                 
                 if filepath:
                     st.success(f"Export generated: {filepath}")
-                    
-                    # Download button
-                    with open(filepath, "rb") as file:
-                        st.download_button(
-                            label="📁 Download File",
-                            data=file.read(),
-                            file_name=Path(filepath).name,
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" if export_format == "xlsx" else "text/csv"
-                        )
+
+                    # Download button. Small files are read in one go; larger
+                    # exports are handed over as a file object so Streamlit
+                    # streams them instead of doubling peak memory.
+                    if Path(filepath).stat().st_size < 10 * 1024 * 1024:
+                        download_data = Path(filepath).read_bytes()
+                    else:
+                        download_data = open(filepath, "rb")
+                    st.download_button(
+                        label="📁 Download File",
+                        data=download_data,
+                        file_name=Path(filepath).name,
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" if export_format == "xlsx" else "text/csv"
+                    )
                 else:
                     st.error("No data available for export")
                     
@@ -465,6 +669,9 @@ elif page == "📤 Export Data":
 
 elif page == "⚙️ System Control":
     st.title("⚙️ System Control")
+    scheduler = get_scheduler()
+    health_monitor = get_health_monitor()
+    quality_checker = get_quality_checker()
     
     # Scheduler status
     st.subheader("📅 Scheduler Status")
@@ -2,17 +2,19 @@
 Simplified Streamlit dashboard for the price tracker system.
 """
 
+import re
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime, timedelta
 import json
 import sys
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
+# Add the project root for imports (once; reruns reuse the cached entry)
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.database.models import DatabaseManager
 from src.utils.export_manager import ExportManager
@@ -77,21 +79,174 @@ page = st.sidebar.selectbox(
 )
 
 # Helper functions
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)  # Cache for 5 minutes
 def load_latest_prices(days=7):
     """Load latest price data."""
     return db_manager.get_latest_prices(days)
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
 def load_health_data():
     """Load system health data."""
     return health_monitor.get_system_health()
 
+@st.cache_data(ttl=300)
+def load_active_skus():
+    """Load active SKU configurations."""
+    return db_manager.get_active_skus()
+
+@st.cache_data(ttl=300)
+def load_active_retailers():
+    """Load active retailer configurations."""
+    return db_manager.get_active_retailers()
+
+@st.cache_resource
+def get_orchestrator():
+    """Long-lived scrape orchestrator, constructed once per server process."""
+    from src.main import PriceTrackerOrchestrator
+    return PriceTrackerOrchestrator()
+
+@st.cache_data(ttl=60)
+def load_daily_price_counts(days=7):
+    """Per-day price counts, aggregated in SQLite for the activity chart."""
+    return pd.Series(dict(db_manager.get_daily_price_counts(days)), name='prices')
+
+@st.cache_data(ttl=30)
+def load_scrape_log_summary(days=7):
+    """Scrape-log totals for pagination and the status tiles."""
+    return db_manager.get_scrape_log_summary(days)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_url_table():
+    """Load all URL mappings; cleared selectively after URL mutations."""
+    return db_manager.get_all_urls()
+
+@st.cache_data(ttl=10)
+def load_table_counts():
+    """Per-table row counts for the debug expander, fetched in one round trip."""
+    with db_manager.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT 'sku_config' as tbl, COUNT(*) as records FROM sku_config
+            UNION ALL SELECT 'retailer_config', COUNT(*) FROM retailer_config
+            UNION ALL SELECT 'sku_retailer_urls', COUNT(*) FROM sku_retailer_urls
+            UNION ALL SELECT 'price_history', COUNT(*) FROM price_history
+            UNION ALL SELECT 'scrape_logs', COUNT(*) FROM scrape_logs
+            UNION ALL SELECT 'schedule_config', COUNT(*) FROM schedule_config
+        """)
+        return [(row['tbl'], row['records']) for row in cursor.fetchall()]
+
+@st.cache_data(ttl=60)
+def load_last_scrape_time():
+    """Timestamp of the newest price row (indexed MAX, refreshed each minute)."""
+    return db_manager.get_max_scraped_at()
+
+@st.cache_data(ttl=600)
+def brand_options():
+    """Distinct brands for the filter sidebar, resolved in SQL."""
+    return db_manager.get_distinct_brands()
+
+@st.cache_data(ttl=600)
+def retailer_options():
+    """Distinct retailer names for the filter sidebar, resolved in SQL."""
+    return db_manager.get_distinct_retailers()
+
+@st.cache_data(max_entries=2)
+def load_export_bytes(filepath, mtime):
+    """Read an export file once per (path, mtime) instead of on every rerun.
+
+    max_entries keeps only the latest couple of exports resident; every
+    click writes a new timestamped file, so an unbounded cache would
+    accumulate the bytes of every export ever generated.
+    """
+    return Path(filepath).read_bytes()
+
+# Well-formed-URL check, compiled once rather than per submission
+_URL_RE = re.compile(r'^https?://\S+$')
+
+# Exactly what the dashboard table shows; the SELECT projects only these
+PRICE_DISPLAY_COLUMNS = ['brand', 'product_name', 'pack_size', 'retailer_name',
+                         'price', 'in_stock', 'scraped_at']
+
+# Display labels applied in-place by st.dataframe, so no renamed copy is built
+PRICE_TABLE_CONFIG = {
+    'brand': st.column_config.TextColumn('Brand'),
+    'product_name': st.column_config.TextColumn('Product'),
+    'pack_size': st.column_config.TextColumn('Pack Size'),
+    'retailer_name': st.column_config.TextColumn('Retailer'),
+    'price': st.column_config.TextColumn('Price'),
+    'in_stock': st.column_config.CheckboxColumn('In Stock'),
+    'scraped_at': st.column_config.DatetimeColumn('Last Updated'),
+}
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def load_prices_df(days=7):
+    """Load latest prices as a ready-made DataFrame.
+
+    Built from column arrays with explicit dtypes rather than a list of
+    dicts, so pandas skips per-key dtype inference; caching memoizes the
+    build and the datetime parse.
+    """
+    df = pd.DataFrame(db_manager.get_latest_prices_columnar(days, PRICE_DISPLAY_COLUMNS),
+                      copy=False)
+    if not df.empty:
+        # scraped_at arrives as datetime objects (PARSE_DECLTYPES) and is
+        # inferred to datetime64 during construction
+        df['price'] = pd.to_numeric(df['price'], downcast='float')
+        df['in_stock'] = df['in_stock'].astype('boolean')
+        for col in ('brand', 'product_name', 'pack_size', 'retailer_name'):
+            df[col] = df[col].astype('category')
+    return df
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def load_price_count(days=1):
+    """Count prices in the window via an indexed COUNT, no row fetch."""
+    return db_manager.count_latest_prices(days)
+
+@st.cache_data(ttl=300)
+def load_config_counts():
+    """Active SKU and retailer counts straight from SQL."""
+    return db_manager.count_active_skus(), db_manager.count_active_retailers()
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def load_quick_stats(days=7):
+    """Quick-stat aggregates computed inside SQLite; one row comes out."""
+    return db_manager.get_price_summary(days)
+
+@st.cache_data(ttl=300)
+def load_filtered_prices(days, brands, retailers):
+    """Load a brand/retailer price slice as a DataFrame; filters run in SQLite."""
+    rows = db_manager.get_latest_prices(days, brands=list(brands), retailers=list(retailers),
+                                        columns=PRICE_DISPLAY_COLUMNS)
+    df = pd.DataFrame(rows)
+    if not df.empty:
+        df['price'] = pd.to_numeric(df['price'], downcast='float')
+        # Category codes make the downstream groupby integer comparisons
+        for col in ('brand', 'product_name', 'pack_size', 'retailer_name'):
+            df[col] = df[col].astype('category')
+    return df
+
+_GBP = "£{:.2f}".format  # bound once; map() calls it without rebuilding
+
+SCRAPE_LOG_PAGE_SIZE = 20
+
+# Simulated base prices by product keyword, used by demo scrape sessions
+BASE_PRICES = {
+    'Paracetamol': 2.50,
+    'Ibuprofen': 3.20,
+    'Aspirin': 2.80,
+    'Vitamin D': 8.50,
+    'Multivitamin': 12.00
+}
+
 def format_currency(value):
     """Format currency values."""
     if pd.isna(value):
         return "N/A"
-    return f"£{value:.2f}"
+    return _GBP(value)
+
+def format_currency_series(prices):
+    """Vectorized format_currency for a whole price column."""
+    return prices.map(_GBP).where(prices.notna(), "N/A")
 
 # Main content based on selected page
 if page == "📊 Dashboard":
@@ -100,20 +255,17 @@ if page == "📊 Dashboard":
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
+    sku_count, retailer_count = load_config_counts()
+    
     with col1:
-        # Total SKUs
-        skus = db_manager.get_active_skus()
-        st.metric("Active SKUs", len(skus))
+        st.metric("Active SKUs", sku_count)
     
     with col2:
-        # Total Retailers
-        retailers = db_manager.get_active_retailers()
-        st.metric("Active Retailers", len(retailers))
+        st.metric("Active Retailers", retailer_count)
     
     with col3:
         # Latest prices count
-        latest_prices = load_latest_prices(1)
-        st.metric("Prices Today", len(latest_prices))
+        st.metric("Prices Today", load_price_count(1))
     
     with col4:
         # System health
@@ -132,42 +284,28 @@ if page == "📊 Dashboard":
         days_filter = st.selectbox("Show data from last:", [1, 3, 7, 14, 30], index=2)
     
     # Load and display data
-    price_data = load_latest_prices(days_filter)
+    df = load_prices_df(days_filter)
     
-    if price_data:
-        df = pd.DataFrame(price_data)
-        df['scraped_at'] = pd.to_datetime(df['scraped_at'])
-        df['price_formatted'] = df['price'].apply(format_currency)
-        
-        # Display table
-        display_columns = ['brand', 'product_name', 'pack_size', 'retailer_name', 
-                          'price_formatted', 'in_stock', 'scraped_at']
+    if not df.empty:
+        # Frame already holds exactly the display columns; format in place
+        df['price'] = format_currency_series(df['price'])
         
         st.dataframe(
-            df[display_columns].rename(columns={
-                'brand': 'Brand',
-                'product_name': 'Product',
-                'pack_size': 'Pack Size',
-                'retailer_name': 'Retailer',
-                'price_formatted': 'Price',
-                'in_stock': 'In Stock',
-                'scraped_at': 'Last Updated'
-            }),
+            df,
             use_container_width=True,
-            hide_index=True
+            hide_index=True,
+            column_config=PRICE_TABLE_CONFIG
         )
         
-        # Quick stats
+        # Quick stats (aggregated in SQL, memoized per filter value)
+        stats = load_quick_stats(days_filter)
         col1, col2, col3 = st.columns(3)
         with col1:
-            avg_price = df['price'].mean()
-            st.metric("Average Price", format_currency(avg_price))
+            st.metric("Average Price", format_currency(stats['avg_price']))
         with col2:
-            in_stock_pct = (df['in_stock'].sum() / len(df)) * 100
-            st.metric("In Stock %", f"{in_stock_pct:.1f}%")
+            st.metric("In Stock %", f"{stats['in_stock_pct'] or 0:.1f}%")
         with col3:
-            unique_products = df['product_name'].nunique()
-            st.metric("Unique Products", unique_products)
+            st.metric("Unique Products", stats['unique_products'])
     else:
         st.info("No price data available. The system needs to be configured with actual product URLs and run a scraping cycle.")
         st.markdown("""
@@ -178,50 +316,59 @@ if page == "📊 Dashboard":
         """)
 
 elif page == "💰 Price Analysis":
-    st.title("💰 Price Analysis")
-    
-    # Load data
-    price_data = load_latest_prices(30)
-    
-    if not price_data:
-        st.warning("No price data available for analysis. Please run a scraping cycle first.")
-        st.stop()
+    # Imported here so chart-free pages skip the plotly import cost
+    import plotly.graph_objects as go
     
-    df = pd.DataFrame(price_data)
-    df['scraped_at'] = pd.to_datetime(df['scraped_at'])
+    st.title("💰 Price Analysis")
     
-    # Filters
+    # Filters (options come from cached config, not a 30-day data load)
     st.sidebar.subheader("Filters")
     
     # Brand filter
-    brands = sorted(df['brand'].unique())
+    brands = brand_options()
     selected_brands = st.sidebar.multiselect("Select Brands:", brands, default=brands[:3])
     
     # Retailer filter
-    retailers = sorted(df['retailer_name'].unique())
+    retailers = retailer_options()
     selected_retailers = st.sidebar.multiselect("Select Retailers:", retailers, default=retailers)
     
-    # Filter data
-    filtered_df = df[
-        (df['brand'].isin(selected_brands)) & 
-        (df['retailer_name'].isin(selected_retailers))
-    ]
+    if not selected_brands or not selected_retailers:
+        st.warning("No data matches the selected filters.")
+        st.stop()
+    
+    # Load only the selected slice; the WHERE clause runs in SQLite
+    filtered_df = load_filtered_prices(30, tuple(selected_brands), tuple(selected_retailers))
     
     if filtered_df.empty:
-        st.warning("No data matches the selected filters.")
+        st.warning("No price data available for analysis. Please run a scraping cycle first.")
         st.stop()
     
     # Price comparison chart
     st.subheader("📊 Price Comparison by Brand")
     
-    fig = px.box(
-        filtered_df, 
-        x='brand', 
-        y='price', 
-        color='retailer_name',
-        title="Price Distribution by Brand and Retailer"
+    # Pre-aggregate five-number summaries so the browser only receives
+    # one box per (brand, retailer) instead of every raw price point
+    box_stats = filtered_df.groupby(['retailer_name', 'brand'], observed=True)['price'].quantile(
+        [0, .25, .5, .75, 1]
+    ).unstack()
+    fig = go.Figure()
+    for retailer, retailer_stats in box_stats.groupby(level='retailer_name', observed=True):
+        rows = retailer_stats.droplevel('retailer_name')
+        fig.add_trace(go.Box(
+            name=retailer,
+            x=rows.index.tolist(),
+            q1=rows[0.25],
+            median=rows[0.5],
+            q3=rows[0.75],
+            lowerfence=rows[0.0],
+            upperfence=rows[1.0],
+            boxpoints=False
+        ))
+    fig.update_layout(
+        title="Price Distribution by Brand and Retailer",
+        boxmode='group',
+        height=500
     )
-    fig.update_layout(height=500)
     st.plotly_chart(fig, use_container_width=True)
 
 elif page == "🔍 Health Monitor":
@@ -305,14 +452,13 @@ elif page == "📤 Export Data":
                 if filepath:
                     st.success(f"Export generated: {filepath}")
                     
-                    # Download button
-                    with open(filepath, "rb") as file:
-                        st.download_button(
-                            label="📁 Download File",
-                            data=file.read(),
-                            file_name=Path(filepath).name,
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" if export_format == "xlsx" else "text/csv"
-                        )
+                    # Download button (bytes cached so reruns don't re-read the file)
+                    st.download_button(
+                        label="📁 Download File",
+                        data=load_export_bytes(filepath, Path(filepath).stat().st_mtime),
+                        file_name=Path(filepath).name,
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" if export_format == "xlsx" else "text/csv"
+                    )
                 else:
                     st.error("No data available for export")
                     
@@ -323,185 +469,242 @@ elif page == "🔗 URL Manager":
     st.title("🔗 URL Manager")
     st.markdown("Manage product URLs for scraping. This interface allows non-technical users to easily add, edit, and remove product URLs.")
     
-    # Get current URLs
-    try:
-        urls = db_manager.get_all_urls()
-        df_urls = pd.DataFrame(urls) if urls else pd.DataFrame()
-    except Exception as e:
-        st.error(f"Error loading URLs: {str(e)}")
-        df_urls = pd.DataFrame()
+    # Mutations rerun just this fragment, not the whole script
+    @st.fragment
+    def url_manager_block():
+        # Get current URLs
+        try:
+            urls = load_url_table()
+            df_urls = pd.DataFrame(urls) if urls else pd.DataFrame()
+        except Exception as e:
+            st.error(f"Error loading URLs: {str(e)}")
+            df_urls = pd.DataFrame()
     
-    # Display current URLs
-    st.subheader("📋 Current URLs")
+        # Display current URLs
+        st.subheader("📋 Current URLs")
     
-    if not df_urls.empty:
-        # Format the display
-        display_df = df_urls.copy()
-        if 'url' in display_df.columns:
-            display_df['url_short'] = display_df['url'].apply(lambda x: x[:50] + "..." if len(x) > 50 else x)
-        else:
-            display_df['url_short'] = "N/A"
+        if not df_urls.empty:
+            # Format the display
+            display_df = df_urls.copy()
+            if 'url' in display_df.columns:
+                urls_str = display_df['url'].astype(str)
+                display_df['url_short'] = urls_str.str.slice(0, 50) + np.where(urls_str.str.len() > 50, "...", "")
+            else:
+                display_df['url_short'] = "N/A"
         
-        # Show table
-        st.dataframe(
-            display_df[['brand', 'product_name', 'pack_size', 'retailer_name', 'url_short', 'is_active']].rename(columns={
-                'brand': 'Brand',
-                'product_name': 'Product',
-                'pack_size': 'Pack Size',
-                'retailer_name': 'Retailer',
-                'url_short': 'URL (truncated)',
-                'is_active': 'Active'
-            }),
-            use_container_width=True,
-            hide_index=True
-        )
+            # Show table (labels via column_config; no renamed copy)
+            st.dataframe(
+                display_df[['brand', 'product_name', 'pack_size', 'retailer_name', 'url_short', 'is_active']],
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'brand': st.column_config.TextColumn('Brand'),
+                    'product_name': st.column_config.TextColumn('Product'),
+                    'pack_size': st.column_config.TextColumn('Pack Size'),
+                    'retailer_name': st.column_config.TextColumn('Retailer'),
+                    'url_short': st.column_config.TextColumn('URL (truncated)'),
+                    'is_active': st.column_config.CheckboxColumn('Active')
+                }
+            )
         
-        st.info(f"Total URLs configured: {len(df_urls)}")
-    else:
-        st.warning("No URLs configured yet. Add some URLs below to start scraping.")
+            st.info(f"Total URLs configured: {len(df_urls)}")
+        else:
+            st.warning("No URLs configured yet. Add some URLs below to start scraping.")
     
-    st.markdown("---")
+        st.markdown("---")
     
-    # Add new URL section
-    st.subheader("➕ Add New URL")
+        # Add new URL section
+        st.subheader("➕ Add New URL")
     
-    with st.form("add_url_form"):
-        col1, col2 = st.columns(2)
+        with st.form("add_url_form"):
+            col1, col2 = st.columns(2)
         
-        with col1:
-            # Get available SKUs and retailers
-            try:
-                skus = db_manager.get_active_skus()
-                retailers = db_manager.get_active_retailers()
-            except Exception as e:
-                st.error(f"Error loading configuration data: {str(e)}")
-                skus = []
-                retailers = []
+            with col1:
+                # Get available SKUs and retailers
+                try:
+                    skus = load_active_skus()
+                    retailers = load_active_retailers()
+                except Exception as e:
+                    st.error(f"Error loading configuration data: {str(e)}")
+                    skus = []
+                    retailers = []
             
-            if not skus:
-                st.error("No SKUs configured. Please add SKUs to the database first.")
-                st.info("You can add SKUs by running the migration script or manually inserting them into the database.")
-                skus = []
+                if not skus:
+                    st.error("No SKUs configured. Please add SKUs to the database first.")
+                    st.info("You can add SKUs by running the migration script or manually inserting them into the database.")
+                    skus = []
             
-            if not retailers:
-                st.error("No retailers configured. Please add retailers to the database first.")
-                st.info("You can add retailers by running the migration script or manually inserting them into the database.")
-                retailers = []
+                if not retailers:
+                    st.error("No retailers configured. Please add retailers to the database first.")
+                    st.info("You can add retailers by running the migration script or manually inserting them into the database.")
+                    retailers = []
             
-            # Only show form if we have both SKUs and retailers
-            if skus and retailers:
-                # SKU selection
-                sku_options = [f"{sku['brand']} - {sku['product_name']} ({sku['pack_size']})" for sku in skus]
-                selected_sku_idx = st.selectbox("Select Product:", range(len(sku_options)), format_func=lambda x: sku_options[x])
-                selected_sku = skus[selected_sku_idx]
+                # Only show form if we have both SKUs and retailers
+                if skus and retailers:
+                    # SKU selection
+                    sku_options = [f"{sku['brand']} - {sku['product_name']} ({sku['pack_size']})" for sku in skus]
+                    selected_sku_idx = st.selectbox("Select Product:", range(len(sku_options)), format_func=lambda x: sku_options[x])
+                    selected_sku = skus[selected_sku_idx]
                 
-                # Retailer selection
-                retailer_options = [retailer['name'] for retailer in retailers]
-                selected_retailer_idx = st.selectbox("Select Retailer:", range(len(retailer_options)), format_func=lambda x: retailer_options[x])
-                selected_retailer = retailers[selected_retailer_idx]
-            else:
-                st.warning("Cannot add URLs without both SKUs and retailers configured.")
-                selected_sku = None
-                selected_retailer = None
+                    # Retailer selection
+                    retailer_options = [retailer['name'] for retailer in retailers]
+                    selected_retailer_idx = st.selectbox("Select Retailer:", range(len(retailer_options)), format_func=lambda x: retailer_options[x])
+                    selected_retailer = retailers[selected_retailer_idx]
+                else:
+                    st.warning("Cannot add URLs without both SKUs and retailers configured.")
+                    selected_sku = None
+                    selected_retailer = None
         
-        with col2:
-            # URL input
-            new_url = st.text_input("Product URL:", placeholder="https://www.retailer.com/product-page")
+            with col2:
+                # URL input
+                new_url = st.text_input("Product URL:", placeholder="https://www.retailer.com/product-page")
             
-            # Active checkbox
-            is_active = st.checkbox("Active", value=True, help="Uncheck to disable scraping for this URL")
+                # Active checkbox
+                is_active = st.checkbox("Active", value=True, help="Uncheck to disable scraping for this URL")
         
-        # Submit button
-        submitted = st.form_submit_button("Add URL")
+            # Submit button
+            submitted = st.form_submit_button("Add URL")
         
-        if submitted:
-            if not selected_sku or not selected_retailer:
-                st.error("Cannot add URL: SKUs and retailers must be configured first.")
-            elif not new_url:
-                st.error("Please enter a URL")
-            elif not new_url.startswith(('http://', 'https://')):
-                st.error("Please enter a valid URL starting with http:// or https://")
-            else:
-                try:
-                    # Add URL to database
-                    result = db_manager.add_url(
-                        sku_id=selected_sku['id'],
-                        retailer_id=selected_retailer['id'],
-                        url=new_url,
-                        is_active=is_active
-                    )
+            if submitted:
+                if not selected_sku or not selected_retailer:
+                    st.error("Cannot add URL: SKUs and retailers must be configured first.")
+                elif not new_url:
+                    st.error("Please enter a URL")
+                elif not _URL_RE.match(new_url):
+                    st.error("Please enter a valid URL starting with http:// or https://")
+                else:
+                    try:
+                        # Add URL to database
+                        result = db_manager.add_url(
+                            sku_id=selected_sku['id'],
+                            retailer_id=selected_retailer['id'],
+                            url=new_url,
+                            is_active=is_active
+                        )
                     
-                    if result:
-                        st.success(f"URL added successfully for {selected_sku['product_name']} at {selected_retailer['name']}")
-                        st.rerun()
+                        if result:
+                            st.success(f"URL added successfully for {selected_sku['product_name']} at {selected_retailer['name']}")
+                            load_url_table.clear()
+                            st.rerun(scope="fragment")
+                        else:
+                            st.error("Failed to add URL. This combination may already exist or there was a database error.")
+                    except Exception as e:
+                        st.error(f"Error adding URL: {str(e)}")
+    
+        # Batch add: many URLs collapse to one transaction and one rerun
+        with st.expander("📋 Batch Add URLs"):
+            st.markdown("Paste one mapping per line as `brand, product name, pack size, retailer, url`.")
+            batch_text = st.text_area(
+                "URL mappings:",
+                placeholder="Flarin, Flarin Joint & Muscular Pain Relief, 12s, Tesco, https://www.tesco.com/..."
+            )
+        
+            if st.button("Add All URLs"):
+                sku_ids = {(sku['brand'].lower(), sku['product_name'].lower(), sku['pack_size'].lower()): sku['id']
+                           for sku in load_active_skus()}
+                retailer_ids = {retailer['name'].lower(): retailer['id'] for retailer in load_active_retailers()}
+            
+                rows = []
+                errors = []
+                for line_no, line in enumerate(batch_text.splitlines(), start=1):
+                    if not line.strip():
+                        continue
+                    parts = [part.strip() for part in line.split(',', 4)]
+                    if len(parts) != 5:
+                        errors.append(f"Line {line_no}: expected 5 comma-separated fields")
+                        continue
+                    brand, product_name, pack_size, retailer_name, batch_url = parts
+                    sku_id = sku_ids.get((brand.lower(), product_name.lower(), pack_size.lower()))
+                    retailer_id = retailer_ids.get(retailer_name.lower())
+                    if sku_id is None:
+                        errors.append(f"Line {line_no}: unknown product '{brand} - {product_name} ({pack_size})'")
+                    elif retailer_id is None:
+                        errors.append(f"Line {line_no}: unknown retailer '{retailer_name}'")
+                    elif not _URL_RE.match(batch_url):
+                        errors.append(f"Line {line_no}: URL must start with http:// or https://")
                     else:
-                        st.error("Failed to add URL. This combination may already exist or there was a database error.")
-                except Exception as e:
-                    st.error(f"Error adding URL: {str(e)}")
+                        rows.append((sku_id, retailer_id, batch_url))
+            
+                for error in errors:
+                    st.error(error)
+            
+                if rows:
+                    try:
+                        db_manager.add_urls_bulk(rows)
+                        st.success(f"Added or updated {len(rows)} URL(s) in one transaction")
+                        load_url_table.clear()
+                        st.rerun(scope="fragment")
+                    except Exception as e:
+                        st.error(f"Error adding URLs: {str(e)}")
     
-    # Edit/Remove URLs section
-    if not df_urls.empty:
-        st.markdown("---")
-        st.subheader("✏️ Edit/Remove URLs")
+        # Edit/Remove URLs section
+        if not df_urls.empty:
+            st.markdown("---")
+            st.subheader("✏️ Edit/Remove URLs")
         
-        # Select URL to edit
-        if 'brand' in df_urls.columns and 'product_name' in df_urls.columns and 'retailer_name' in df_urls.columns:
-            url_options = [f"{row['brand']} - {row['product_name']} @ {row['retailer_name']}" for _, row in df_urls.iterrows()]
-            selected_url_idx = st.selectbox("Select URL to edit:", range(len(url_options)), format_func=lambda x: url_options[x])
-            selected_url_data = df_urls.iloc[selected_url_idx]
+            # Select URL to edit
+            if 'brand' in df_urls.columns and 'product_name' in df_urls.columns and 'retailer_name' in df_urls.columns:
+                url_options = (df_urls['brand'].astype(str) + ' - ' + df_urls['product_name'].astype(str)
+                               + ' @ ' + df_urls['retailer_name'].astype(str)).tolist()
+                selected_url_idx = st.selectbox("Select URL to edit:", range(len(url_options)), format_func=lambda x: url_options[x])
+                selected_url_data = df_urls.iloc[selected_url_idx]
             
-            col1, col2 = st.columns(2)
+                col1, col2 = st.columns(2)
             
-            with col1:
-                # Edit URL form
-                with st.form("edit_url_form"):
-                    st.write(f"**Editing:** {selected_url_data.get('brand', 'N/A')} - {selected_url_data.get('product_name', 'N/A')}")
+                with col1:
+                    # Edit URL form
+                    with st.form("edit_url_form"):
+                        st.write(f"**Editing:** {selected_url_data.get('brand', 'N/A')} - {selected_url_data.get('product_name', 'N/A')}")
                     
-                    edited_url = st.text_input("URL:", value=selected_url_data.get('url', ''))
-                    edited_active = st.checkbox("Active", value=selected_url_data.get('is_active', True))
+                        edited_url = st.text_input("URL:", value=selected_url_data.get('url', ''))
+                        edited_active = st.checkbox("Active", value=selected_url_data.get('is_active', True))
                     
-                    col_update, col_remove = st.columns(2)
+                        col_update, col_remove = st.columns(2)
                     
-                    with col_update:
-                        update_submitted = st.form_submit_button("Update URL", type="primary")
+                        with col_update:
+                            update_submitted = st.form_submit_button("Update URL", type="primary")
                     
-                    with col_remove:
-                        remove_submitted = st.form_submit_button("Remove URL", type="secondary")
+                        with col_remove:
+                            remove_submitted = st.form_submit_button("Remove URL", type="secondary")
                     
-                    if update_submitted:
-                        try:
-                            db_manager.update_url(
-                                sku_id=selected_url_data.get('sku_id'),
-                                retailer_id=selected_url_data.get('retailer_id'),
-                                url=edited_url,
-                                is_active=edited_active
-                            )
-                            st.success("URL updated successfully!")
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Error updating URL: {str(e)}")
+                        if update_submitted:
+                            try:
+                                db_manager.update_url(
+                                    sku_id=selected_url_data.get('sku_id'),
+                                    retailer_id=selected_url_data.get('retailer_id'),
+                                    url=edited_url,
+                                    is_active=edited_active
+                                )
+                                st.success("URL updated successfully!")
+                                load_url_table.clear()
+                                st.rerun(scope="fragment")
+                            except Exception as e:
+                                st.error(f"Error updating URL: {str(e)}")
                     
-                    if remove_submitted:
-                        try:
-                            db_manager.remove_url(
-                                sku_id=selected_url_data.get('sku_id'),
-                                retailer_id=selected_url_data.get('retailer_id')
-                            )
-                            st.success("URL removed successfully!")
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Error removing URL: {str(e)}")
+                        if remove_submitted:
+                            try:
+                                db_manager.remove_url(
+                                    sku_id=selected_url_data.get('sku_id'),
+                                    retailer_id=selected_url_data.get('retailer_id')
+                                )
+                                st.success("URL removed successfully!")
+                                load_url_table.clear()
+                                st.rerun(scope="fragment")
+                            except Exception as e:
+                                st.error(f"Error removing URL: {str(e)}")
             
-            with col2:
-                # URL preview
-                st.write("**Current URL:**")
-                st.code(selected_url_data.get('url', 'N/A'))
+                with col2:
+                    # URL preview
+                    st.write("**Current URL:**")
+                    st.code(selected_url_data.get('url', 'N/A'))
                 
-                st.write("**Status:**")
-                status_icon = "✅" if selected_url_data.get('is_active', False) else "❌"
-                st.write(f"{status_icon} {'Active' if selected_url_data.get('is_active', False) else 'Inactive'}")
-        else:
-            st.warning("URL data structure is incomplete. Please check the database.")
+                    st.write("**Status:**")
+                    status_icon = "✅" if selected_url_data.get('is_active', False) else "❌"
+                    st.write(f"{status_icon} {'Active' if selected_url_data.get('is_active', False) else 'Inactive'}")
+            else:
+                st.warning("URL data structure is incomplete. Please check the database.")
+
+    url_manager_block()
 
 elif page == "🚀 Scraping Control":
     st.title("🚀 Scraping Control")
@@ -511,23 +714,17 @@ elif page == "🚀 Scraping Control":
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        urls = db_manager.get_all_urls()
+        urls = load_url_table()
         active_urls = [url for url in urls if url['is_active']]
         st.metric("Active URLs", len(active_urls))
     
     with col2:
-        # Get latest scrape data
-        latest_prices_data = load_latest_prices(1)
-        if latest_prices_data:
-            # Convert to DataFrame for easier handling
-            latest_prices = pd.DataFrame(latest_prices_data)
-            last_scrape = pd.to_datetime(latest_prices['scraped_at']).max()
-            st.metric("Last Scrape", last_scrape.strftime("%H:%M") if pd.notna(last_scrape) else "Never")
-        else:
-            st.metric("Last Scrape", "Never")
+        # One indexed MAX(scraped_at) instead of loading a day of rows
+        last_scrape = load_last_scrape_time()
+        st.metric("Last Scrape", pd.Timestamp(last_scrape).strftime("%H:%M") if last_scrape else "Never")
     
     with col3:
-        st.metric("Total Products", len(db_manager.get_active_skus()))
+        st.metric("Total Products", load_config_counts()[0])
     
     st.markdown("---")
     
@@ -567,7 +764,6 @@ elif page == "🚀 Scraping Control":
                     try:
                         # Import and run scraper
                         import asyncio
-                        from src.main import PriceTrackerOrchestrator
                         import time
                         
                         # Create progress bar
@@ -578,105 +774,115 @@ elif page == "🚀 Scraping Control":
                         status_text.text("Initializing scraper...")
                         progress_bar.progress(5)
                         
-                        scraper = PriceTrackerOrchestrator()
+                        scraper = get_orchestrator()
                         
                         # Log scraping session start
                         session_start = time.time()
                         successful_scrapes = 0
                         failed_scrapes = 0
                         
+                        # Buffer bookkeeping rows; one transaction at the end
+                        price_rows = []
+                        log_rows = []
+                        
                         status_text.text("Starting scrape session...")
                         progress_bar.progress(10)
                         
-                        # Simulate scraping each URL with logging
-                        for i, url_data in enumerate(active_urls):
-                            url_brand = url_data.get('brand', 'Unknown')
-                            url_retailer = url_data.get('retailer_name', 'Unknown')
-                            
-                            status_text.text(f"Scraping {url_brand} @ {url_retailer}... ({i+1}/{len(active_urls)})")
-                            
-                            # Simulate scraping attempt
-                            scrape_start = time.time()
-                            
-                            try:
-                                # Simulate scraping logic with actual price data collection
-                                time.sleep(1 + (i * 0.3))  # Simulate variable response times
-                                
-                                # Simulate success/failure (90% success rate for demo)
-                                import random
-                                if random.random() < 0.9:
-                                    # Success - Generate realistic price data
-                                    response_time = time.time() - scrape_start
-                                    
-                                    # Generate realistic price based on product type
-                                    base_prices = {
-                                        'Paracetamol': 2.50,
-                                        'Ibuprofen': 3.20,
-                                        'Aspirin': 2.80,
-                                        'Vitamin D': 8.50,
-                                        'Multivitamin': 12.00
-                                    }
-                                    
-                                    product_name = url_data.get('product_name', 'Unknown Product')
-                                    base_price = base_prices.get(product_name.split()[0], 5.00)
-                                    # Add some random variation (±20%)
-                                    price_variation = random.uniform(0.8, 1.2)
-                                    simulated_price = round(base_price * price_variation, 2)
+                        import random
+                        
+                        # Resolve each SKU's simulated base price once, outside the hot loop
+                        base_lookup = {
+                            url_data.get('sku_id', 1): BASE_PRICES.get(
+                                (url_data.get('product_name') or 'Unknown Product').split()[0], 5.00)
+                            for url_data in active_urls
+                        }
+                        
+                        async def scrape_one(url_data, semaphore):
+                            """Simulate one scrape; returns (price_row or None, log_row)."""
+                            async with semaphore:
+                                scrape_start = time.time()
+                                try:
+                                    # Simulated response latency; awaiting lets URLs overlap
+                                    await asyncio.sleep(random.uniform(1.0, 2.0))
                                     
-                                    # Save actual price data
-                                    try:
-                                        db_manager.save_price_data(
-                                            sku_id=url_data.get('sku_id', 1),
-                                            retailer_id=url_data.get('retailer_id', 1),
-                                            price=simulated_price,
-                                            currency='GBP',
-                                            in_stock=True,
-                                            availability_text='In Stock',
-                                            product_title=f"{url_data.get('brand', 'Generic')} {product_name}",
-                                            raw_data=f'{{"simulated": true, "price": {simulated_price}, "currency": "GBP"}}'
+                                    # Simulate success/failure (90% success rate for demo)
+                                    if random.random() < 0.9:
+                                        response_time = time.time() - scrape_start
+                                        product_name = url_data.get('product_name', 'Unknown Product')
+                                        base_price = base_lookup[url_data.get('sku_id', 1)]
+                                        # Add some random variation (±20%)
+                                        simulated_price = round(base_price * random.uniform(0.8, 1.2), 2)
+                                        
+                                        price_row = (
+                                            url_data.get('sku_id', 1),
+                                            url_data.get('retailer_id', 1),
+                                            simulated_price,
+                                            'GBP',
+                                            True,
+                                            'In Stock',
+                                            f"{url_data.get('brand', 'Generic')} {product_name}",
+                                            json.dumps({"simulated": True, "price": simulated_price,
+                                                        "currency": "GBP"}, separators=(',', ':'))
                                         )
-                                    except AttributeError:
-                                        # Method not available, just log the attempt
-                                        pass
-                                    
-                                    # Log the scraping attempt
-                                    db_manager.log_scrape_attempt(
-                                        sku_id=url_data.get('sku_id', 1),
-                                        retailer_id=url_data.get('retailer_id', 1),
-                                        status='success',
-                                        response_time=response_time,
-                                        user_agent='Streamlit-Dashboard-Manual-Scrape'
-                                    )
-                                    successful_scrapes += 1
-                                else:
-                                    # Failure
+                                        log_row = (
+                                            url_data.get('sku_id', 1),
+                                            url_data.get('retailer_id', 1),
+                                            'success',
+                                            None,
+                                            response_time,
+                                            'Streamlit-Dashboard-Manual-Scrape'
+                                        )
+                                    else:
+                                        response_time = time.time() - scrape_start
+                                        price_row = None
+                                        log_row = (
+                                            url_data.get('sku_id', 1),
+                                            url_data.get('retailer_id', 1),
+                                            'failed',
+                                            'Simulated scraping failure for demo',
+                                            response_time,
+                                            'Streamlit-Dashboard-Manual-Scrape'
+                                        )
+                                except Exception as scrape_error:
                                     response_time = time.time() - scrape_start
-                                    db_manager.log_scrape_attempt(
-                                        sku_id=url_data.get('sku_id', 1),
-                                        retailer_id=url_data.get('retailer_id', 1),
-                                        status='failed',
-                                        error_message='Simulated scraping failure for demo',
-                                        response_time=response_time,
-                                        user_agent='Streamlit-Dashboard-Manual-Scrape'
+                                    price_row = None
+                                    log_row = (
+                                        url_data.get('sku_id', 1),
+                                        url_data.get('retailer_id', 1),
+                                        'failed',
+                                        str(scrape_error),
+                                        response_time,
+                                        'Streamlit-Dashboard-Manual-Scrape'
                                     )
-                                    failed_scrapes += 1
-                                    
-                            except Exception as scrape_error:
-                                # Log the failure
-                                response_time = time.time() - scrape_start
-                                db_manager.log_scrape_attempt(
-                                    sku_id=url_data.get('sku_id', 1),
-                                    retailer_id=url_data.get('retailer_id', 1),
-                                    status='failed',
-                                    error_message=str(scrape_error),
-                                    response_time=response_time,
-                                    user_agent='Streamlit-Dashboard-Manual-Scrape'
-                                )
+                                return price_row, log_row
+                        
+                        async def run_session():
+                            """Scrape all URLs concurrently, at most 10 in flight."""
+                            semaphore = asyncio.Semaphore(10)
+                            tasks = [asyncio.create_task(scrape_one(url_data, semaphore))
+                                     for url_data in active_urls]
+                            results = []
+                            for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                                results.append(await task)
+                                status_text.text(f"Scraped {done}/{len(tasks)} URLs...")
+                                progress_bar.progress(int(done / len(tasks) * 90) + 10)
+                            return results
+                        
+                        for price_row, log_row in asyncio.run(run_session()):
+                            if price_row:
+                                price_rows.append(price_row)
+                                successful_scrapes += 1
+                            else:
                                 failed_scrapes += 1
-                            
-                            # Update progress
-                            progress = int((i + 1) / len(active_urls) * 90) + 10
-                            progress_bar.progress(progress)
+                            log_rows.append(log_row)
+                        
+                        # Flush the whole session's bookkeeping in two transactions
+                        db_manager.bulk_save_price_data(price_rows)
+                        db_manager.bulk_log_scrape_attempts(log_rows)
+
+                        # Fold the session's rows into the daily rollup the
+                        # Trends page reads
+                        db_manager.refresh_daily_rollup()
                         
                         # Complete the session
                         progress_bar.progress(100)
@@ -715,231 +921,238 @@ elif page == "🚀 Scraping Control":
     st.markdown("---")
     
     # Scheduling controls
-    st.subheader("⏰ Scheduling")
+    @st.fragment
+    def scheduling_block():
+        st.subheader("⏰ Scheduling")
     
-    # Get current schedule configuration from database
-    try:
-        schedule_config = db_manager.get_schedule_config()
-    except AttributeError:
-        # Fallback if method doesn't exist (cache issue)
-        st.warning("⚠️ Schedule configuration method not available. Please refresh the page.")
-        schedule_config = {
-            'schedule_enabled': False,
-            'schedule_time': '09:00',
-            'schedule_timezone': 'UTC'
-        }
+        # Get current schedule configuration from database
+        try:
+            schedule_config = db_manager.get_schedule_config()
+        except AttributeError:
+            # Fallback if method doesn't exist (cache issue)
+            st.warning("⚠️ Schedule configuration method not available. Please refresh the page.")
+            schedule_config = {
+                'schedule_enabled': False,
+                'schedule_time': '09:00',
+                'schedule_timezone': 'UTC'
+            }
     
-    col1, col2 = st.columns([2, 1])
+        col1, col2 = st.columns([2, 1])
     
-    with col1:
-        st.write("**Automated Scraping Schedule**")
+        with col1:
+            st.write("**Automated Scraping Schedule**")
         
-        # Use database value for checkbox
-        schedule_enabled = st.checkbox(
-            "Enable scheduled scraping",
-            value=schedule_config.get('schedule_enabled', False)
-        )
+            # Use database value for checkbox
+            schedule_enabled = st.checkbox(
+                "Enable scheduled scraping",
+                value=schedule_config.get('schedule_enabled', False)
+            )
         
-        if schedule_enabled:
-            # Use database value for time input
-            current_time_str = schedule_config.get('schedule_time', '09:00')
-            try:
-                current_time = pd.Timestamp(current_time_str).time()
-            except:
-                current_time = pd.Timestamp("09:00").time()
+            if schedule_enabled:
+                # Use database value for time input
+                current_time_str = schedule_config.get('schedule_time', '09:00')
+                try:
+                    current_time = pd.Timestamp(current_time_str).time()
+                except:
+                    current_time = pd.Timestamp("09:00").time()
                 
-            schedule_time = st.time_input("Daily scrape time", value=current_time)
+                schedule_time = st.time_input("Daily scrape time", value=current_time)
             
-            # Save schedule configuration when changed
-            if st.button("💾 Save Schedule", use_container_width=True):
-                try:
-                    success = db_manager.update_schedule_config(
-                        enabled=schedule_enabled,
-                        schedule_time=schedule_time.strftime('%H:%M'),
-                        timezone='UTC'
-                    )
-                    if success:
-                        st.success("✅ Schedule configuration saved!")
-                        st.rerun()
-                    else:
-                        st.error("❌ Failed to save schedule configuration")
-                except AttributeError:
-                    st.error("❌ Schedule configuration method not available. Please refresh the page to reload the updated code.")
-                except Exception as e:
-                    st.error(f"❌ Error saving schedule: {str(e)}")
+                # Save schedule configuration when changed
+                if st.button("💾 Save Schedule", use_container_width=True):
+                    try:
+                        success = db_manager.update_schedule_config(
+                            enabled=schedule_enabled,
+                            schedule_time=schedule_time.strftime('%H:%M'),
+                            timezone='UTC'
+                        )
+                        if success:
+                            st.success("✅ Schedule configuration saved!")
+                            st.rerun(scope="fragment")
+                        else:
+                            st.error("❌ Failed to save schedule configuration")
+                    except AttributeError:
+                        st.error("❌ Schedule configuration method not available. Please refresh the page to reload the updated code.")
+                    except Exception as e:
+                        st.error(f"❌ Error saving schedule: {str(e)}")
             
-            st.info(f"Scraping will run daily at {schedule_time}")
+                st.info(f"Scraping will run daily at {schedule_time}")
             
-            # Show next scheduled run
-            from datetime import datetime, timedelta
-            now = datetime.now()
-            next_run = datetime.combine(now.date(), schedule_time)
-            if next_run <= now:
-                next_run += timedelta(days=1)
+                # Show next scheduled run
+                from datetime import datetime, timedelta
+                now = datetime.now()
+                next_run = datetime.combine(now.date(), schedule_time)
+                if next_run <= now:
+                    next_run += timedelta(days=1)
             
-            st.write(f"**Next scheduled run:** {next_run.strftime('%Y-%m-%d %H:%M')}")
-        else:
-            st.write("Scheduled scraping is currently disabled.")
+                st.write(f"**Next scheduled run:** {next_run.strftime('%Y-%m-%d %H:%M')}")
+            else:
+                st.write("Scheduled scraping is currently disabled.")
     
-    with col2:
-        st.write("**Schedule Actions**")
+        with col2:
+            st.write("**Schedule Actions**")
         
-        if schedule_enabled:
-            if st.button("💾 Save Schedule", type="primary", use_container_width=True):
-                st.success("✅ Schedule saved!")
-                st.info("Note: Scheduling requires a persistent server environment.")
+            if schedule_enabled:
+                if st.button("💾 Save Schedule", type="primary", use_container_width=True):
+                    st.success("✅ Schedule saved!")
+                    st.info("Note: Scheduling requires a persistent server environment.")
             
-            if st.button("⏸️ Pause Schedule", use_container_width=True):
-                st.info("Schedule paused")
-        else:
-            st.write("Enable scheduling to see controls")
+                if st.button("⏸️ Pause Schedule", use_container_width=True):
+                    st.info("Schedule paused")
+            else:
+                st.write("Enable scheduling to see controls")
+
+    scheduling_block()
     
     st.markdown("---")
     
     # Recent scraping activity
-    st.subheader("📊 Recent Activity")
+    @st.fragment
+    def recent_activity_block():
+        st.subheader("📊 Recent Activity")
     
-    # Create tabs for different views
-    tab1, tab2, tab3 = st.tabs(["📈 Price Data", "📋 Scrape Logs", "⚡ Live Progress"])
+        # Create tabs for different views
+        tab1, tab2, tab3 = st.tabs(["📈 Price Data", "📋 Scrape Logs", "⚡ Live Progress"])
     
-    with tab1:
-        # Show recent price data
-        try:
-            recent_data_list = load_latest_prices(7)
-            if recent_data_list:
-                # Convert to DataFrame
-                recent_data = pd.DataFrame(recent_data_list)
-                st.write(f"**Last 7 days:** {len(recent_data)} price points collected")
-                
-                # Group by date
-                recent_data['scraped_at'] = pd.to_datetime(recent_data['scraped_at'])
-                daily_counts = recent_data.groupby(recent_data['scraped_at'].dt.date).size()
+        with tab1:
+            # Show recent price data (per-day counts aggregated in SQL)
+            try:
+                daily_counts = load_daily_price_counts(7)
+                if not daily_counts.empty:
+                    st.write(f"**Last 7 days:** {int(daily_counts.sum())} price points collected")
                 
-                if len(daily_counts) > 0:
                     st.bar_chart(daily_counts)
                 
-                # Show recent entries
-                with st.expander("Recent Price Data"):
-                    display_cols = ['brand', 'product_name', 'retailer_name', 'price', 'scraped_at']
-                    if all(col in recent_data.columns for col in display_cols):
-                        recent_sample = recent_data[display_cols].head(10)
+                    # Show recent entries
+                    with st.expander("Recent Price Data"):
+                        display_cols = ['brand', 'product_name', 'retailer_name', 'price', 'scraped_at']
+                        # Slice the 10 rows first, then project, so the
+                        # column selection copies 10 rows instead of all
+                        recent_sample = load_prices_df(7).head(10)[display_cols]
                         st.dataframe(recent_sample, use_container_width=True)
-            else:
-                st.info("No recent price data available. Run a manual scrape to get started!")
-        except Exception as e:
-            st.warning(f"Could not load recent price data: {str(e)}")
+                else:
+                    st.info("No recent price data available. Run a manual scrape to get started!")
+            except Exception as e:
+                st.warning(f"Could not load recent price data: {str(e)}")
     
-    with tab2:
-        # Show scrape logs
-        try:
-            scrape_logs = db_manager.get_scrape_logs(days=7, limit=50)
-            if scrape_logs:
-                st.write(f"**Last 7 days:** {len(scrape_logs)} scrape attempts")
-                
-                # Convert to DataFrame for better display
-                logs_df = pd.DataFrame(scrape_logs)
-                logs_df['scraped_at'] = pd.to_datetime(logs_df['scraped_at'])
+        with tab2:
+            # Show scrape logs (one page at a time; totals come from SQL)
+            try:
+                log_summary = load_scrape_log_summary(7)
+                total_logs = log_summary['total']
+                if total_logs:
+                    st.write(f"**Last 7 days:** {total_logs} scrape attempts")
                 
-                # Status summary
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    success_count = len(logs_df[logs_df['status'] == 'success'])
-                    st.metric("✅ Successful", success_count)
-                with col2:
-                    failed_count = len(logs_df[logs_df['status'] == 'failed'])
-                    st.metric("❌ Failed", failed_count)
-                with col3:
-                    if len(logs_df) > 0:
-                        success_rate = (success_count / len(logs_df)) * 100
+                    # Status summary over the whole window, not just this page
+                    success_count = log_summary['successful']
+                    failed_count = total_logs - success_count
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("✅ Successful", success_count)
+                    with col2:
+                        st.metric("❌ Failed", failed_count)
+                    with col3:
+                        success_rate = (success_count / total_logs) * 100
                         st.metric("📊 Success Rate", f"{success_rate:.1f}%")
                 
-                # Recent logs table
-                st.write("**Recent Scrape Attempts:**")
-                display_logs = logs_df[['scraped_at', 'brand', 'retailer_name', 'status', 'response_time', 'error_message']].head(20)
+                    # Recent logs table, fetched one page at a time
+                    st.write("**Recent Scrape Attempts:**")
+                    total_pages = -(-total_logs // SCRAPE_LOG_PAGE_SIZE)
+                    page = st.number_input("Page", min_value=1, max_value=total_pages, value=1)
+                    scrape_logs = db_manager.get_scrape_logs(
+                        days=7, limit=SCRAPE_LOG_PAGE_SIZE,
+                        offset=(page - 1) * SCRAPE_LOG_PAGE_SIZE
+                    )
+                    logs_df = pd.DataFrame(scrape_logs)
                 
-                # Format the display
-                display_logs['scraped_at'] = display_logs['scraped_at'].dt.strftime('%Y-%m-%d %H:%M:%S')
-                display_logs['response_time'] = display_logs['response_time'].apply(
-                    lambda x: f"{x:.2f}s" if pd.notna(x) else "N/A"
-                )
-                display_logs['error_message'] = display_logs['error_message'].apply(
-                    lambda x: x[:50] + "..." if pd.notna(x) and len(str(x)) > 50 else (x if pd.notna(x) else "")
-                )
+                    display_logs = logs_df[['scraped_at', 'brand', 'retailer_name', 'status', 'response_time', 'error_message']]
                 
-                # Color code status
-                def color_status(val):
-                    if val == 'success':
-                        return 'background-color: #d4edda; color: #155724'
-                    elif val == 'failed':
-                        return 'background-color: #f8d7da; color: #721c24'
-                    else:
-                        return 'background-color: #fff3cd; color: #856404'
+                    # Format the display
+                    display_logs['scraped_at'] = display_logs['scraped_at'].dt.strftime('%Y-%m-%d %H:%M:%S')
+                    response_times = display_logs['response_time']
+                    display_logs['response_time'] = response_times.map("{:.2f}s".format).where(
+                        response_times.notna(), "N/A"
+                    )
+                    messages = display_logs['error_message'].fillna('').astype(str)
+                    display_logs['error_message'] = messages.str.slice(0, 50) + np.where(
+                        messages.str.len() > 50, "...", ""
+                    )
+                
+                    # Color code status (one numpy pass over the column)
+                    def color_status(statuses):
+                        return np.where(
+                            statuses == 'success',
+                            'background-color: #d4edda; color: #155724',
+                            np.where(
+                                statuses == 'failed',
+                                'background-color: #f8d7da; color: #721c24',
+                                'background-color: #fff3cd; color: #856404'
+                            )
+                        )
                 
-                styled_logs = display_logs.style.applymap(color_status, subset=['status'])
-                st.dataframe(styled_logs, use_container_width=True)
+                    styled_logs = display_logs.style.apply(color_status, subset=['status'])
+                    st.dataframe(styled_logs, use_container_width=True)
                 
-            else:
-                st.info("No scrape logs available. Scraping attempts will appear here.")
-        except Exception as e:
-            st.warning(f"Could not load scrape logs: {str(e)}")
+                else:
+                    st.info("No scrape logs available. Scraping attempts will appear here.")
+            except Exception as e:
+                st.warning(f"Could not load scrape logs: {str(e)}")
     
-    with tab3:
-        # Live progress tracking
-        st.write("**Real-time Scraping Progress**")
-        
-        # Check if scraping is currently running (this would be enhanced with actual state management)
-        if 'scraping_in_progress' not in st.session_state:
-            st.session_state.scraping_in_progress = False
-        
-        if st.session_state.scraping_in_progress:
-            st.info("🔄 Scraping in progress...")
-            
-            # Progress bar placeholder
-            progress_placeholder = st.empty()
-            status_placeholder = st.empty()
-            
-            # This would be updated in real-time during actual scraping
-            with progress_placeholder.container():
-                st.progress(0.7)  # Example progress
-            with status_placeholder.container():
-                st.text("Scraping Tesco products... (5/7 completed)")
-            
-            if st.button("🛑 Stop Scraping"):
+        with tab3:
+            # Live progress tracking
+            st.write("**Real-time Scraping Progress**")
+
+            # Check if scraping is currently running (this would be enhanced with actual state management)
+            if 'scraping_in_progress' not in st.session_state:
                 st.session_state.scraping_in_progress = False
-                st.rerun()
-        else:
-            st.info("No active scraping session. Start a scrape to see live progress here.")
+
+            # Poll every 2s only while a scrape runs; an idle page never repolls
+            @st.fragment(run_every="2s" if st.session_state.scraping_in_progress else None)
+            def live_progress_block():
+                if not st.session_state.scraping_in_progress:
+                    # Scrape finished between polls; fall back to the idle view
+                    st.rerun()
+                st.info("🔄 Scraping in progress...")
+
+                # Progress bar placeholder
+                progress_placeholder = st.empty()
+                status_placeholder = st.empty()
+
+                # This would be updated in real-time during actual scraping
+                with progress_placeholder.container():
+                    st.progress(0.7)  # Example progress
+                with status_placeholder.container():
+                    st.text("Scraping Tesco products... (5/7 completed)")
+
+                if st.button("🛑 Stop Scraping"):
+                    st.session_state.scraping_in_progress = False
+                    st.rerun()
+
+            if st.session_state.scraping_in_progress:
+                live_progress_block()
+            else:
+                st.info("No active scraping session. Start a scrape to see live progress here.")
             
-            # Show last scraping session summary if available
-            try:
-                recent_logs = db_manager.get_scrape_logs(days=1, limit=10)
-                if recent_logs:
-                    last_session = pd.DataFrame(recent_logs)
-                    last_session['scraped_at'] = pd.to_datetime(last_session['scraped_at'])
-                    
-                    # Group by approximate session (within 10 minutes)
-                    if len(last_session) > 0:
-                        latest_time = last_session['scraped_at'].max()
-                        session_logs = last_session[
-                            last_session['scraped_at'] >= (latest_time - pd.Timedelta(minutes=10))
-                        ]
-                        
-                        if len(session_logs) > 0:
-                            st.write("**Last Scraping Session:**")
-                            col1, col2, col3 = st.columns(3)
-                            with col1:
-                                st.metric("URLs Scraped", len(session_logs))
-                            with col2:
-                                success_count = len(session_logs[session_logs['status'] == 'success'])
-                                st.metric("Successful", success_count)
-                            with col3:
-                                avg_time = session_logs['response_time'].mean()
-                                if pd.notna(avg_time):
-                                    st.metric("Avg Response Time", f"{avg_time:.2f}s")
-                                else:
-                                    st.metric("Avg Response Time", "N/A")
-            except Exception as e:
-                st.write(f"Could not load session data: {str(e)}")
+                # Show last scraping session summary if available
+                try:
+                    session_stats = db_manager.get_last_session_stats()
+                    if session_stats:
+                        st.write("**Last Scraping Session:**")
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.metric("URLs Scraped", session_stats['urls'])
+                        with col2:
+                            st.metric("Successful", session_stats['successful'])
+                        with col3:
+                            avg_time = session_stats['avg_response']
+                            if avg_time is not None:
+                                st.metric("Avg Response Time", f"{avg_time:.2f}s")
+                            else:
+                                st.metric("Avg Response Time", "N/A")
+                except Exception as e:
+                    st.write(f"Could not load session data: {str(e)}")
+
+    recent_activity_block()
 
 # Footer
 st.sidebar.markdown("---")
@@ -947,65 +1160,60 @@ st.sidebar.markdown("**Price Tracker v1.0**")
 st.sidebar.markdown("Built for Flarin")
 
 # Show system info
-with st.sidebar.expander("System Information"):
-    st.write("**Database:** SQLite")
-    st.write("**SKUs Configured:** ", len(db_manager.get_active_skus()))
-    st.write("**Retailers Configured:** ", len(db_manager.get_active_retailers()))
-    st.write("**Last Updated:** ", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+@st.fragment
+def system_info_block():
+    with st.sidebar.expander("System Information"):
+        st.write("**Database:** SQLite")
+        st.write("**SKUs Configured:** ", load_config_counts()[0])
+        st.write("**Retailers Configured:** ", load_config_counts()[1])
+        st.write("**Last Updated:** ", load_last_scrape_time() or "Never")
+
+system_info_block()
 
 # Debug section for persistence issues (moved outside sidebar to avoid nesting)
 if page == "🚀 Scraping Control":
-    with st.expander("🔧 Debug Information", expanded=False):
-        st.write("**Database Information:**")
-        col1, col2 = st.columns(2)
+    @st.fragment
+    def debug_block():
+        with st.expander("🔧 Debug Information", expanded=False):
+            st.write("**Database Information:**")
+            col1, col2 = st.columns(2)
         
-        with col1:
-            st.write(f"Database Path: `{db_manager.db_path}`")
+            with col1:
+                st.write(f"Database Path: `{db_manager.db_path}`")
             
-            # Check if database file exists
-            import os
-            db_exists = os.path.exists(db_manager.db_path)
-            st.write(f"Database File Exists: {'✅' if db_exists else '❌'}")
+                # Check if database file exists
+                import os
+                db_exists = os.path.exists(db_manager.db_path)
+                st.write(f"Database File Exists: {'✅' if db_exists else '❌'}")
             
-            if db_exists:
-                db_size = os.path.getsize(db_manager.db_path)
-                st.write(f"Database Size: {db_size:,} bytes")
+                if db_exists:
+                    db_size = os.path.getsize(db_manager.db_path)
+                    st.write(f"Database Size: {db_size:,} bytes")
         
-        with col2:
-            # Show table counts
+            with col2:
+                # Show table counts
+                try:
+                    for table, count in load_table_counts():
+                        st.write(f"{table}: {count} records")
+                except Exception as e:
+                    st.error(f"Database connection error: {str(e)}")
+        
+            # Show current schedule config
+            st.write("**Current Schedule Configuration:**")
             try:
-                with db_manager.get_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    # Count records in each table
-                    tables = ['sku_config', 'retailer_config', 'sku_retailer_urls', 
-                             'price_history', 'scrape_logs', 'schedule_config']
-                    
-                    for table in tables:
-                        try:
-                            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                            count = cursor.fetchone()[0]
-                            st.write(f"{table}: {count} records")
-                        except Exception as e:
-                            st.write(f"{table}: Error - {str(e)}")
-                            
+                schedule_config = db_manager.get_schedule_config()
+                st.json(schedule_config)
+            except AttributeError:
+                st.warning("Schedule configuration method not available - cache needs refresh")
             except Exception as e:
-                st.error(f"Database connection error: {str(e)}")
+                st.error(f"Error getting schedule config: {str(e)}")
         
-        # Show current schedule config
-        st.write("**Current Schedule Configuration:**")
-        try:
-            schedule_config = db_manager.get_schedule_config()
-            st.json(schedule_config)
-        except AttributeError:
-            st.warning("Schedule configuration method not available - cache needs refresh")
-        except Exception as e:
-            st.error(f"Error getting schedule config: {str(e)}")
-        
-        # Clear cache button
-        if st.button("🔄 Clear Streamlit Cache"):
-            st.cache_resource.clear()
-            st.success("Cache cleared! Please refresh the page.")
+            # Clear cache button
+            if st.button("🔄 Clear Streamlit Cache"):
+                st.cache_resource.clear()
+                st.success("Cache cleared! Please refresh the page.")
+
+    debug_block()
 
 def main():
     """Main function to run the dashboard."""
@@ -3,13 +3,16 @@ URL Management interface for the price tracker system.
 This provides a user-friendly way to manage product URLs without technical knowledge.
 """
 
+import re
 import streamlit as st
 import pandas as pd
 import sys
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
+# Add the project root for imports (once; reruns reuse the cached entry)
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.database.models import DatabaseManager
 
@@ -28,6 +31,9 @@ def init_db():
 
 db_manager = init_db()
 
+# Well-formed-URL check, compiled once rather than per submission
+_URL_RE = re.compile(r'^https?://\S+$')
+
 st.title("🔗 Product URL Manager")
 st.markdown("Manage product URLs for price tracking without technical knowledge")
 
@@ -41,6 +47,7 @@ section = st.sidebar.selectbox(
     ["📋 View Current URLs", "➕ Add New URL", "✏️ Edit URLs", "🗑️ Remove URLs"]
 )
 
+@st.cache_data(ttl=60)
 def load_url_data():
     """Load current URL mappings with product and retailer details."""
     with db_manager.get_connection() as conn:
@@ -62,15 +69,20 @@ def load_url_data():
         """
         return pd.read_sql_query(query, conn)
 
-def get_available_skus():
-    """Get list of available SKUs."""
-    skus = db_manager.get_active_skus()
-    return {f"{sku['brand']} - {sku['product_name']} ({sku['pack_size']})": sku['id'] for sku in skus}
+@st.cache_data(ttl=60)
+def load_url_summary():
+    """URL totals straight from SQL, so metrics don't need the full table."""
+    return db_manager.get_url_summary()
 
-def get_available_retailers():
-    """Get list of available retailers."""
+@st.cache_data(ttl=60)
+def get_pickers():
+    """SKU and retailer picker options, fetched together on one connection."""
+    skus = db_manager.get_active_skus()
     retailers = db_manager.get_active_retailers()
-    return {retailer['name']: retailer['id'] for retailer in retailers}
+    return (
+        {f"{sku['brand']} - {sku['product_name']} ({sku['pack_size']})": sku['id'] for sku in skus},
+        {retailer['name']: retailer['id'] for retailer in retailers},
+    )
 
 if section == "📋 View Current URLs":
     st.subheader("📋 Current Product URLs")
@@ -80,15 +92,14 @@ if section == "📋 View Current URLs":
     
     if not url_data.empty:
         # Display summary
+        summary = load_url_summary()
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Total URLs", len(url_data))
+            st.metric("Total URLs", summary['total_urls'])
         with col2:
-            active_urls = len(url_data[url_data['active'] == 1])
-            st.metric("Active URLs", active_urls)
+            st.metric("Active URLs", summary['active_urls'])
         with col3:
-            unique_products = url_data['sku_id'].nunique()
-            st.metric("Products Covered", unique_products)
+            st.metric("Products Covered", summary['products_covered'])
         
         st.markdown("---")
         
@@ -112,43 +123,36 @@ if section == "📋 View Current URLs":
         if retailer_filter != "All":
             filtered_data = filtered_data[filtered_data['retailer_name'] == retailer_filter]
         
-        # Display table
+        # Display table one page at a time, so only 50 rows are serialized
+        # to the frontend per render
         display_columns = ['brand', 'product_name', 'pack_size', 'retailer_name', 'product_url', 'active']
-        
+        page_size = 50
+        total_pages = max(1, -(-len(filtered_data) // page_size))
+        page = st.number_input("Page", min_value=1, max_value=total_pages, value=1,
+                               key="url_table_page") if total_pages > 1 else 1
+        start = (page - 1) * page_size
+
         st.dataframe(
-            filtered_data[display_columns].rename(columns={
-                'brand': 'Brand',
-                'product_name': 'Product',
-                'pack_size': 'Pack Size',
-                'retailer_name': 'Retailer',
-                'product_url': 'Product URL',
-                'active': 'Active'
-            }),
+            filtered_data[display_columns].iloc[start:start + page_size],
             use_container_width=True,
-            hide_index=True
+            hide_index=True,
+            column_config={
+                'brand': st.column_config.TextColumn('Brand'),
+                'product_name': st.column_config.TextColumn('Product'),
+                'pack_size': st.column_config.TextColumn('Pack Size'),
+                'retailer_name': st.column_config.TextColumn('Retailer'),
+                'product_url': st.column_config.LinkColumn('Product URL'),
+                'active': st.column_config.CheckboxColumn('Active')
+            }
         )
+        if total_pages > 1:
+            st.caption(f"Page {page} of {total_pages} ({len(filtered_data)} URLs)")
         
         # URL validation status
         st.subheader("🔍 URL Status Check")
         
-        # Check for missing URLs
-        missing_urls = []
-        skus = db_manager.get_active_skus()
-        retailers = db_manager.get_active_retailers()
-        
-        for sku in skus:
-            for retailer in retailers:
-                existing = url_data[
-                    (url_data['sku_id'] == sku['id']) & 
-                    (url_data['retailer_id'] == retailer['id'])
-                ]
-                if existing.empty:
-                    missing_urls.append({
-                        'brand': sku['brand'],
-                        'product_name': sku['product_name'],
-                        'pack_size': sku['pack_size'],
-                        'retailer_name': retailer['name']
-                    })
+        # One SQL anti-join finds every pair with no URL configured
+        missing_urls = db_manager.get_missing_url_pairs()
         
         if missing_urls:
             st.warning(f"⚠️ {len(missing_urls)} product-retailer combinations are missing URLs")
@@ -165,8 +169,7 @@ elif section == "➕ Add New URL":
     st.subheader("➕ Add New Product URL")
     
     # Get available options
-    available_skus = get_available_skus()
-    available_retailers = get_available_retailers()
+    available_skus, available_retailers = get_pickers()
     
     with st.form("add_url_form"):
         col1, col2 = st.columns(2)
@@ -198,30 +201,27 @@ elif section == "➕ Add New URL":
         if submitted:
             if not product_url:
                 st.error("Please enter a product URL")
-            elif not product_url.startswith(('http://', 'https://')):
+            elif not _URL_RE.match(product_url):
                 st.error("Please enter a valid URL starting with http:// or https://")
             else:
                 try:
-                    # Check if URL already exists
+                    # One INSERT OR IGNORE; the UNIQUE(sku_id, retailer_id)
+                    # constraint detects duplicates without a prior SELECT
                     with db_manager.get_connection() as conn:
                         cursor = conn.cursor()
                         cursor.execute("""
-                            SELECT id FROM sku_retailer_urls 
-                            WHERE sku_id = ? AND retailer_id = ?
-                        """, (selected_sku_id, selected_retailer_id))
-                        existing = cursor.fetchone()
-                        
-                        if existing:
+                            INSERT OR IGNORE INTO sku_retailer_urls (sku_id, retailer_id, product_url, active)
+                            VALUES (?, ?, ?, ?)
+                        """, (selected_sku_id, selected_retailer_id, product_url, active))
+
+                        if cursor.rowcount == 0:
                             st.error("A URL already exists for this product-retailer combination. Use 'Edit URLs' to modify it.")
                         else:
-                            # Insert new URL
-                            cursor.execute("""
-                                INSERT INTO sku_retailer_urls (sku_id, retailer_id, product_url, active)
-                                VALUES (?, ?, ?, ?)
-                            """, (selected_sku_id, selected_retailer_id, product_url, active))
                             conn.commit()
-                            
+
                             st.success(f"✅ Successfully added URL for {selected_sku_name} at {selected_retailer_name}")
+                            load_url_data.clear()
+                            load_url_summary.clear()
                             st.rerun()
                             
                 except Exception as e:
@@ -234,11 +234,10 @@ elif section == "✏️ Edit URLs":
     url_data = load_url_data()
     
     if not url_data.empty:
-        # Select URL to edit
-        url_options = {}
-        for _, row in url_data.iterrows():
-            display_name = f"{row['brand']} - {row['product_name']} ({row['pack_size']}) @ {row['retailer_name']}"
-            url_options[display_name] = row['id']
+        # Select URL to edit (labels built column-wise, no row iteration)
+        labels = (url_data['brand'] + " - " + url_data['product_name']
+                  + " (" + url_data['pack_size'] + ") @ " + url_data['retailer_name'])
+        url_options = dict(zip(labels, url_data['id']))
         
         selected_url_name = st.selectbox(
             "Select URL to Edit:",
@@ -269,7 +268,7 @@ elif section == "✏️ Edit URLs":
             if submitted:
                 if not new_url:
                     st.error("Please enter a product URL")
-                elif not new_url.startswith(('http://', 'https://')):
+                elif not _URL_RE.match(new_url):
                     st.error("Please enter a valid URL starting with http:// or https://")
                 else:
                     try:
@@ -283,6 +282,8 @@ elif section == "✏️ Edit URLs":
                             conn.commit()
                             
                             st.success("✅ URL updated successfully!")
+                            load_url_data.clear()
+                            load_url_summary.clear()
                             st.rerun()
                             
                     except Exception as e:
@@ -299,11 +300,10 @@ elif section == "🗑️ Remove URLs":
     if not url_data.empty:
         st.warning("⚠️ Removing URLs will stop price tracking for those product-retailer combinations.")
         
-        # Select URLs to remove
-        url_options = {}
-        for _, row in url_data.iterrows():
-            display_name = f"{row['brand']} - {row['product_name']} ({row['pack_size']}) @ {row['retailer_name']}"
-            url_options[display_name] = row['id']
+        # Select URLs to remove (labels built column-wise, no row iteration)
+        labels = (url_data['brand'] + " - " + url_data['product_name']
+                  + " (" + url_data['pack_size'] + ") @ " + url_data['retailer_name'])
+        url_options = dict(zip(labels, url_data['id']))
         
         selected_urls = st.multiselect(
             "Select URLs to Remove:",
@@ -325,14 +325,21 @@ elif section == "🗑️ Remove URLs":
                     
                     with db_manager.get_connection() as conn:
                         cursor = conn.cursor()
-                        placeholders = ','.join(['?' for _ in selected_ids])
-                        cursor.execute(f"""
-                            DELETE FROM sku_retailer_urls 
-                            WHERE id IN ({placeholders})
-                        """, selected_ids)
+                        # Chunk to stay under SQLite's bound-variable limit;
+                        # the single commit keeps it one transaction
+                        for start in range(0, len(selected_ids), 500):
+                            chunk = selected_ids[start:start + 500]
+                            placeholders = ','.join(['?' for _ in chunk])
+                            cursor.execute(f"""
+                                DELETE FROM sku_retailer_urls 
+                                WHERE id IN ({placeholders})
+                            """, chunk)
                         conn.commit()
                         
                         st.success(f"✅ Successfully removed {len(selected_urls)} URL(s)")
+                        load_url_data.clear()
+                        load_url_summary.clear()
+                        get_pickers.clear()
                         st.rerun()
                         
                 except Exception as e:
@@ -366,12 +373,10 @@ with st.sidebar.expander("💡 Help & Tips"):
 
 # System status
 with st.sidebar.expander("📊 System Status"):
-    url_data = load_url_data()
-    if not url_data.empty:
-        total_urls = len(url_data)
-        active_urls = len(url_data[url_data['active'] == 1])
-        st.write(f"**Total URLs:** {total_urls}")
-        st.write(f"**Active URLs:** {active_urls}")
-        st.write(f"**Inactive URLs:** {total_urls - active_urls}")
+    summary = load_url_summary()
+    if summary['total_urls']:
+        st.write(f"**Total URLs:** {summary['total_urls']}")
+        st.write(f"**Active URLs:** {summary['active_urls']}")
+        st.write(f"**Inactive URLs:** {summary['total_urls'] - summary['active_urls']}")
     else:
         st.write("**No URLs configured**")
\ No newline at end of file
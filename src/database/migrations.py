@@ -2,27 +2,28 @@
 Database migration script to initialize the price tracker database.
 """
 
-import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from src.database.models import DatabaseManager
+
+import orjson
+
+from src.database.models import DatabaseManager, SCHEMA_TABLES_DDL
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def load_config_data():
-    """Load SKU and retailer configuration from JSON files."""
+    """Load SKU and retailer configuration from JSON files (parsed once)."""
     config_dir = Path("config")
-    
-    # Load SKUs
-    with open(config_dir / "skus.json", "r") as f:
-        skus_data = json.load(f)
-    
-    # Load retailers
-    with open(config_dir / "retailers.json", "r") as f:
-        retailers_data = json.load(f)
-    
+
+    # orjson parses the raw bytes directly; the cache skips re-reading on
+    # repeated calls within a process
+    skus_data = orjson.loads((config_dir / "skus.json").read_bytes())
+    retailers_data = orjson.loads((config_dir / "retailers.json").read_bytes())
+
     return skus_data, retailers_data
 
 
@@ -30,29 +31,24 @@ def populate_initial_data(db_manager: DatabaseManager):
     """Populate database with initial SKU and retailer data."""
     skus_data, retailers_data = load_config_data()
     
-    # Insert SKUs
+    # Insert SKUs in one batch rather than a commit per row
     logger.info("Inserting SKU configurations...")
-    for sku in skus_data["skus"]:
-        if sku["active"]:
-            db_manager.insert_sku(
-                brand=sku["brand"],
-                product_name=sku["product_name"],
-                pack_size=sku["pack_size"],
-                formulation=sku.get("formulation"),
-                category=sku.get("category")
-            )
-    
-    # Insert retailers
+    sku_rows = [
+        (sku["brand"], sku["product_name"], sku["pack_size"],
+         sku.get("formulation"), sku.get("category"))
+        for sku in skus_data["skus"] if sku["active"]
+    ]
+    db_manager.insert_skus_bulk(sku_rows)
+
+    # Insert retailers the same way
     logger.info("Inserting retailer configurations...")
-    for retailer in retailers_data["retailers"]:
-        if retailer["active"]:
-            db_manager.insert_retailer(
-                name=retailer["name"],
-                base_url=retailer["base_url"],
-                scraper_module=retailer["scraper_module"],
-                selectors=json.dumps(retailer.get("selectors", {})),
-                wait_selectors=json.dumps(retailer.get("wait_selectors", []))
-            )
+    retailer_rows = [
+        (retailer["name"], retailer["base_url"], retailer["scraper_module"],
+         orjson.dumps(retailer.get("selectors", {})).decode(),
+         orjson.dumps(retailer.get("wait_selectors", [])).decode())
+        for retailer in retailers_data["retailers"] if retailer["active"]
+    ]
+    db_manager.insert_retailers_bulk(retailer_rows)
 
 
 def create_sample_url_mappings(db_manager: DatabaseManager):
@@ -76,30 +72,101 @@ def create_sample_url_mappings(db_manager: DatabaseManager):
     
     with db_manager.get_connection() as conn:
         cursor = conn.cursor()
-        for mapping in sample_mappings:
-            cursor.execute("""
-                INSERT OR IGNORE INTO sku_retailer_urls (sku_id, retailer_id, product_url)
-                VALUES (?, ?, ?)
-            """, (mapping["sku_id"], mapping["retailer_id"], mapping["url"]))
+        cursor.executemany("""
+            INSERT OR IGNORE INTO sku_retailer_urls (sku_id, retailer_id, product_url)
+            VALUES (?, ?, ?)
+        """, [(m["sku_id"], m["retailer_id"], m["url"]) for m in sample_mappings])
         conn.commit()
 
 
+def _replacement_table_ddl(table: str) -> str:
+    """Pull a single table's CREATE statement out of the schema script."""
+    marker = f"CREATE TABLE IF NOT EXISTS {table} ("
+    for statement in SCHEMA_TABLES_DDL.split(";"):
+        if marker in statement:
+            return statement
+    raise ValueError(f"No schema DDL found for table {table}")
+
+
+def drop_autoincrement(db_manager: DatabaseManager):
+    """Rebuild insert-heavy tables that still carry AUTOINCREMENT.
+
+    CREATE TABLE IF NOT EXISTS never alters an existing database, so
+    databases created before the schema dropped AUTOINCREMENT keep
+    paying its per-insert sqlite_sequence update. Each table's rename,
+    recreate, copy and drop runs inside one explicit transaction, so an
+    interrupted run leaves either the untouched original or the finished
+    rebuild — never a live empty table with the rows stranded in *_old.
+    A leftover *_old table from an earlier interrupted run is folded
+    back in before rebuilding; already-migrated tables are untouched.
+    """
+    rebuilt = False
+    conn = db_manager.get_connection()
+    cursor = conn.cursor()
+    for table in ("price_history", "scrape_logs", "health_metrics"):
+        cursor.execute("BEGIN")
+        try:
+            leftover = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (f"{table}_old",)).fetchone()
+            if leftover is not None:
+                logger.info(f"Recovering interrupted rebuild of {table}...")
+                live = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (table,)).fetchone()
+                if live is None:
+                    # Crashed between rename and recreate: just rename back
+                    cursor.execute(f"ALTER TABLE {table}_old RENAME TO {table}")
+                else:
+                    # Crashed mid-copy: OR IGNORE skips rows already copied
+                    # (ids are the primary key), then the stranded table goes
+                    cursor.execute(
+                        f"INSERT OR IGNORE INTO {table} SELECT * FROM {table}_old")
+                    cursor.execute(f"DROP TABLE {table}_old")
+                rebuilt = True
+            row = cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (table,)).fetchone()
+            if row is not None and "AUTOINCREMENT" in row["sql"]:
+                logger.info(f"Rebuilding {table} without AUTOINCREMENT...")
+                cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+                cursor.execute(_replacement_table_ddl(table))
+                cursor.execute(f"INSERT INTO {table} SELECT * FROM {table}_old")
+                # Dropping the old table takes its renamed-along indexes with it
+                cursor.execute(f"DROP TABLE {table}_old")
+                rebuilt = True
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    if rebuilt:
+        # Recreate the indexes the dropped _old tables took down
+        db_manager.create_indexes()
+
+
 def main():
     """Main migration function."""
     logger.info("Starting database migration...")
-    
+
     # Initialize database manager
     db_manager = DatabaseManager()
-    
-    # Create tables
+
+    # Create tables first, load data, then index: bulk inserts into
+    # unindexed tables skip per-row index maintenance
     logger.info("Creating database tables...")
-    db_manager.create_tables()
-    
+    db_manager.create_base_tables()
+
     # Populate initial data
     populate_initial_data(db_manager)
     
     # Create sample URL mappings
     create_sample_url_mappings(db_manager)
+
+    # Index the populated tables and backfill the rollup
+    db_manager.create_tables()
+
+    # Rebuild any pre-existing tables that still carry AUTOINCREMENT
+    drop_autoincrement(db_manager)
     
     # Log health summary
     health = db_manager.get_health_summary()
@@ -4,13 +4,149 @@ Database models and schema definitions for the price tracker system.
 
 import sqlite3
 import logging
+import threading
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+# Full schema, parsed once at import and applied with a single executescript.
+# Tables and indexes are kept separate so the initial migration can bulk-load
+# before the indexes exist.
+SCHEMA_TABLES_DDL = """
+-- SKU Configuration Table
+CREATE TABLE IF NOT EXISTS sku_config (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    brand TEXT NOT NULL,
+    product_name TEXT NOT NULL,
+    pack_size TEXT NOT NULL,
+    formulation TEXT,
+    category TEXT,
+    active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Retailer Configuration Table
+CREATE TABLE IF NOT EXISTS retailer_config (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    base_url TEXT NOT NULL,
+    scraper_module TEXT NOT NULL,
+    selectors TEXT, -- JSON string
+    wait_selectors TEXT, -- JSON string
+    active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- SKU-Retailer URL Mapping Table
+CREATE TABLE IF NOT EXISTS sku_retailer_urls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sku_id INTEGER NOT NULL,
+    retailer_id INTEGER NOT NULL,
+    product_url TEXT NOT NULL,
+    custom_selectors TEXT, -- JSON string for retailer-specific overrides
+    active BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (sku_id) REFERENCES sku_config (id),
+    FOREIGN KEY (retailer_id) REFERENCES retailer_config (id),
+    UNIQUE(sku_id, retailer_id)
+);
+
+-- Price History Table (plain INTEGER PRIMARY KEY: the high-rate insert
+-- tables skip AUTOINCREMENT's sqlite_sequence update per row)
+CREATE TABLE IF NOT EXISTS price_history (
+    id INTEGER PRIMARY KEY,
+    sku_id INTEGER NOT NULL,
+    retailer_id INTEGER NOT NULL,
+    price DECIMAL(10,2),
+    currency TEXT DEFAULT 'GBP',
+    in_stock BOOLEAN,
+    availability_text TEXT,
+    product_title TEXT,
+    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    raw_data TEXT, -- JSON string of all scraped data
+    FOREIGN KEY (sku_id) REFERENCES sku_config (id),
+    FOREIGN KEY (retailer_id) REFERENCES retailer_config (id)
+);
+
+-- Scrape Logs Table
+CREATE TABLE IF NOT EXISTS scrape_logs (
+    id INTEGER PRIMARY KEY,
+    sku_id INTEGER,
+    retailer_id INTEGER,
+    status TEXT NOT NULL, -- 'success', 'failed', 'partial'
+    error_message TEXT,
+    response_time REAL,
+    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    user_agent TEXT,
+    ip_address TEXT,
+    FOREIGN KEY (sku_id) REFERENCES sku_config (id),
+    FOREIGN KEY (retailer_id) REFERENCES retailer_config (id)
+);
+
+-- Health Metrics Table
+CREATE TABLE IF NOT EXISTS health_metrics (
+    id INTEGER PRIMARY KEY,
+    metric_name TEXT NOT NULL,
+    metric_value REAL,
+    metric_text TEXT,
+    recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Scheduling Configuration Table
+CREATE TABLE IF NOT EXISTS schedule_config (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    schedule_enabled BOOLEAN DEFAULT 0,
+    schedule_time TEXT, -- Time in HH:MM format
+    schedule_timezone TEXT DEFAULT 'UTC',
+    last_run TIMESTAMP,
+    next_run TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Daily Price Rollup Table (refreshed after each scrape cycle)
+CREATE TABLE IF NOT EXISTS sku_price_daily (
+    sku_id INTEGER NOT NULL,
+    retailer_id INTEGER NOT NULL,
+    day DATE NOT NULL,
+    price DECIMAL(10,2),
+    in_stock BOOLEAN,
+    sample_count INTEGER,
+    PRIMARY KEY (sku_id, retailer_id, day),
+    FOREIGN KEY (sku_id) REFERENCES sku_config (id),
+    FOREIGN KEY (retailer_id) REFERENCES retailer_config (id)
+);
+
+"""
+
+SCHEMA_INDEXES_DDL = """
+-- Indexes for better performance
+CREATE INDEX IF NOT EXISTS idx_price_history_sku_retailer ON price_history(sku_id, retailer_id);
+CREATE INDEX IF NOT EXISTS idx_price_history_scraped_at ON price_history(scraped_at);
+CREATE INDEX IF NOT EXISTS idx_price_history_sku_retailer_time ON price_history(sku_id, retailer_id, scraped_at);
+CREATE INDEX IF NOT EXISTS idx_scrape_logs_status ON scrape_logs(status);
+CREATE INDEX IF NOT EXISTS idx_scrape_logs_scraped_at ON scrape_logs(scraped_at);
+
+-- Covering indexes: the dashboard's time-window queries touch only these
+-- columns, so they can be answered from index pages alone
+CREATE INDEX IF NOT EXISTS idx_price_history_covering
+    ON price_history(scraped_at DESC, sku_id, retailer_id, price, in_stock, availability_text);
+CREATE INDEX IF NOT EXISTS idx_scrape_logs_covering
+    ON scrape_logs(scraped_at DESC, status, sku_id, retailer_id, response_time);
+
+-- Refresh planner statistics so the new indexes actually get picked
+ANALYZE;
+"""
+
+SCHEMA_DDL = SCHEMA_TABLES_DDL + SCHEMA_INDEXES_DDL
+
+
 class DatabaseManager:
     """Manages SQLite database operations for the price tracker."""
     
@@ -23,137 +159,90 @@ class DatabaseManager:
         else:
             self.db_path = db_path
         self.ensure_data_directory()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        self._price_batch: List[Tuple[Any, ...]] = []
         
     def ensure_data_directory(self):
         """Ensure the data directory exists."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         
     def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get the shared database connection, opening it on first use.
+
+        One long-lived connection (check_same_thread=False, so Streamlit's
+        per-rerun script threads can reuse it) keeps the page cache warm
+        and pays connection setup and PRAGMA cost once instead of per
+        query. SQLite's serialized threading mode handles cross-thread
+        statement safety; the lock only guards lazy creation.
+        """
+        if self._conn is None:
+            with self._conn_lock:
+                if self._conn is None:
+                    # PARSE_DECLTYPES hands TIMESTAMP columns back as
+                    # datetime objects, so callers skip string parsing.
+                    # cached_statements raised from the default 128 so every
+                    # distinct query here stays prepared across calls
+                    conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                           detect_types=sqlite3.PARSE_DECLTYPES,
+                                           cached_statements=256)
+                    conn.row_factory = sqlite3.Row
+                    # Tuning for the dashboard's read-heavy workload. WAL lets
+                    # readers run alongside the scraper's writes.
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    conn.execute("PRAGMA temp_store=MEMORY")
+                    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+                    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+                    conn.execute("PRAGMA optimize")  # re-analyze only when stats are stale
+                    conn.execute("PRAGMA busy_timeout=5000")  # dashboard reads while scraper writes
+                    self._conn = conn
+        return self._conn
         
+    def create_base_tables(self):
+        """Create the tables alone, so a bulk load can run unindexed."""
+        with self.get_connection() as conn:
+            conn.executescript(SCHEMA_TABLES_DDL)
+
+    def create_indexes(self):
+        """Create the indexes and refresh planner statistics."""
+        with self.get_connection() as conn:
+            conn.executescript(SCHEMA_INDEXES_DDL)
+
     def create_tables(self):
         """Create all database tables."""
+        with self.get_connection() as conn:
+            # One executescript parses and applies the whole schema in a
+            # single pass (it commits itself)
+            conn.executescript(SCHEMA_DDL)
+            logger.info("Database tables created successfully")
+
+        # Backfill the daily rollup the first time the table appears
+        with self.get_connection() as conn:
+            if conn.execute("SELECT COUNT(*) FROM sku_price_daily").fetchone()[0] == 0:
+                self.refresh_daily_rollup(days=None)
+
+    def refresh_daily_rollup(self, days: int = 2) -> int:
+        """Refresh the sku_price_daily rollup from price_history.
+
+        Only the trailing `days` window is recomputed (the partitions a
+        scrape cycle can touch); pass None to rebuild the whole table.
+        """
+        where = "WHERE scraped_at >= datetime('now', ?)" if days else ""
+        params = ('-{} days'.format(days),) if days else ()
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            
-            # SKU Configuration Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sku_config (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    brand TEXT NOT NULL,
-                    product_name TEXT NOT NULL,
-                    pack_size TEXT NOT NULL,
-                    formulation TEXT,
-                    category TEXT,
-                    active BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Retailer Configuration Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS retailer_config (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL UNIQUE,
-                    base_url TEXT NOT NULL,
-                    scraper_module TEXT NOT NULL,
-                    selectors TEXT, -- JSON string
-                    wait_selectors TEXT, -- JSON string
-                    active BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # SKU-Retailer URL Mapping Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sku_retailer_urls (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    sku_id INTEGER NOT NULL,
-                    retailer_id INTEGER NOT NULL,
-                    product_url TEXT NOT NULL,
-                    custom_selectors TEXT, -- JSON string for retailer-specific overrides
-                    active BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (sku_id) REFERENCES sku_config (id),
-                    FOREIGN KEY (retailer_id) REFERENCES retailer_config (id),
-                    UNIQUE(sku_id, retailer_id)
-                )
-            """)
-            
-            # Price History Table
             cursor.execute("""
-                CREATE TABLE IF NOT EXISTS price_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    sku_id INTEGER NOT NULL,
-                    retailer_id INTEGER NOT NULL,
-                    price DECIMAL(10,2),
-                    currency TEXT DEFAULT 'GBP',
-                    in_stock BOOLEAN,
-                    availability_text TEXT,
-                    product_title TEXT,
-                    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    raw_data TEXT, -- JSON string of all scraped data
-                    FOREIGN KEY (sku_id) REFERENCES sku_config (id),
-                    FOREIGN KEY (retailer_id) REFERENCES retailer_config (id)
-                )
-            """)
-            
-            # Scrape Logs Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS scrape_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    sku_id INTEGER,
-                    retailer_id INTEGER,
-                    status TEXT NOT NULL, -- 'success', 'failed', 'partial'
-                    error_message TEXT,
-                    response_time REAL,
-                    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    user_agent TEXT,
-                    ip_address TEXT,
-                    FOREIGN KEY (sku_id) REFERENCES sku_config (id),
-                    FOREIGN KEY (retailer_id) REFERENCES retailer_config (id)
-                )
-            """)
-            
-            # Health Metrics Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS health_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    metric_name TEXT NOT NULL,
-                    metric_value REAL,
-                    metric_text TEXT,
-                    recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Scheduling Configuration Table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS schedule_config (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    schedule_enabled BOOLEAN DEFAULT 0,
-                    schedule_time TEXT, -- Time in HH:MM format
-                    schedule_timezone TEXT DEFAULT 'UTC',
-                    last_run TIMESTAMP,
-                    next_run TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Create indexes for better performance
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_price_history_sku_retailer ON price_history(sku_id, retailer_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_price_history_scraped_at ON price_history(scraped_at)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_scrape_logs_status ON scrape_logs(status)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_scrape_logs_scraped_at ON scrape_logs(scraped_at)")
-            
+                INSERT OR REPLACE INTO sku_price_daily
+                    (sku_id, retailer_id, day, price, in_stock, sample_count)
+                SELECT sku_id, retailer_id, date(scraped_at),
+                       AVG(price), MAX(in_stock), COUNT(*)
+                FROM price_history
+                {}
+                GROUP BY sku_id, retailer_id, date(scraped_at)
+            """.format(where), params)
             conn.commit()
-            logger.info("Database tables created successfully")
+            return cursor.rowcount
             
     def insert_sku(self, brand: str, product_name: str, pack_size: str, 
                    formulation: str = None, category: str = None) -> int:
@@ -176,20 +265,40 @@ class DatabaseManager:
                 VALUES (?, ?, ?, ?, ?)
             """, (name, base_url, scraper_module, selectors, wait_selectors))
             return cursor.lastrowid
-            
-    def insert_price_data(self, sku_id: int, retailer_id: int, price: float,
-                         in_stock: bool, availability_text: str = None,
-                         product_title: str = None, raw_data: str = None) -> int:
-        """Insert price data."""
+
+    def insert_skus_bulk(self, rows: List[Tuple[Any, ...]]) -> int:
+        """Insert many SKU configurations with one executemany/commit.
+
+        Each row is (brand, product_name, pack_size, formulation, category).
+        """
+        if not rows:
+            return 0
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO price_history (sku_id, retailer_id, price, in_stock, 
-                                         availability_text, product_title, raw_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (sku_id, retailer_id, price, in_stock, availability_text, product_title, raw_data))
-            return cursor.lastrowid
-            
+            cursor.executemany("""
+                INSERT INTO sku_config (brand, product_name, pack_size, formulation, category)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+            return cursor.rowcount
+
+    def insert_retailers_bulk(self, rows: List[Tuple[Any, ...]]) -> int:
+        """Insert many retailer configurations with one executemany/commit.
+
+        Each row is (name, base_url, scraper_module, selectors, wait_selectors).
+        """
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO retailer_config (name, base_url, scraper_module, selectors, wait_selectors)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+            return cursor.rowcount
+
+
     def log_scrape_attempt(self, sku_id: int, retailer_id: int, status: str,
                           error_message: str = None, response_time: float = None,
                           user_agent: str = None) -> int:
@@ -203,8 +312,31 @@ class DatabaseManager:
             """, (sku_id, retailer_id, status, error_message, response_time, user_agent))
             return cursor.lastrowid
     
-    def get_scrape_logs(self, days: int = 7, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get recent scrape logs with SKU and retailer details."""
+    def bulk_log_scrape_attempts(self, rows: List[Tuple[Any, ...]]) -> int:
+        """Insert many scrape-log rows with one executemany/commit.
+
+        Each row is (sku_id, retailer_id, status, error_message,
+        response_time, user_agent).
+        """
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO scrape_logs (sku_id, retailer_id, status, error_message, 
+                                       response_time, user_agent)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+            return cursor.rowcount
+
+    def get_scrape_logs(self, days: int = 7, limit: int = 100,
+                        offset: int = 0) -> List[Dict[str, Any]]:
+        """Get recent scrape logs with SKU and retailer details.
+
+        limit/offset page through the window so callers fetch only the
+        rows they will actually render.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -212,33 +344,81 @@ class DatabaseManager:
                 FROM scrape_logs sl
                 LEFT JOIN sku_config sc ON sl.sku_id = sc.id
                 LEFT JOIN retailer_config rc ON sl.retailer_id = rc.id
-                WHERE sl.scraped_at >= datetime('now', '-{} days')
+                WHERE sl.scraped_at >= datetime('now', ?)
                 ORDER BY sl.scraped_at DESC
-                LIMIT ?
-            """.format(days), (limit,))
+                LIMIT ? OFFSET ?
+            """, ('-{} days'.format(days), limit, offset))
             return [dict(row) for row in cursor.fetchall()]
-            
+
+    def get_scrape_log_summary(self, days: int = 7) -> Dict[str, int]:
+        """Total and successful scrape-attempt counts for the window."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*) as total,
+                       COALESCE(SUM(status = 'success'), 0) as successful
+                FROM scrape_logs
+                WHERE scraped_at >= datetime('now', ?)
+            """, ('-{} days'.format(days),))
+            return dict(cursor.fetchone())
+
+    def get_last_session_stats(self) -> Optional[Dict[str, Any]]:
+        """Stats for the most recent scrape session (logs within 10 minutes of the newest)."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*) as urls,
+                       COALESCE(SUM(status = 'success'), 0) as successful,
+                       AVG(response_time) as avg_response
+                FROM scrape_logs
+                WHERE scraped_at >= datetime(
+                    (SELECT MAX(scraped_at) FROM scrape_logs), '-10 minutes')
+            """)
+            stats = dict(cursor.fetchone())
+            return stats if stats['urls'] else None
+
     def get_active_skus(self) -> List[Dict[str, Any]]:
-        """Get all active SKUs."""
+        """Get all active SKUs (only the columns consumers read)."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM sku_config WHERE active = 1")
+            cursor.execute("""
+                SELECT id, brand, product_name, pack_size, formulation, category
+                FROM sku_config WHERE active = 1
+            """)
             return [dict(row) for row in cursor.fetchall()]
-            
+
     def get_active_retailers(self) -> List[Dict[str, Any]]:
-        """Get all active retailers."""
+        """Get all active retailers (only the columns consumers read)."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM retailer_config WHERE active = 1")
+            cursor.execute("""
+                SELECT id, name, base_url, scraper_module
+                FROM retailer_config WHERE active = 1
+            """)
             return [dict(row) for row in cursor.fetchall()]
             
+    def get_missing_url_pairs(self) -> List[Dict[str, Any]]:
+        """Get active SKU-retailer combinations that have no URL configured."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT sc.brand, sc.product_name, sc.pack_size,
+                       rc.name as retailer_name
+                FROM sku_config sc
+                CROSS JOIN retailer_config rc
+                LEFT JOIN sku_retailer_urls sru
+                    ON sru.sku_id = sc.id AND sru.retailer_id = rc.id
+                WHERE sru.id IS NULL AND sc.active = 1 AND rc.active = 1
+                ORDER BY sc.brand, sc.product_name, rc.name
+            """)
+            return [dict(row) for row in cursor.fetchall()]
+
     def get_sku_retailer_urls(self) -> List[Dict[str, Any]]:
         """Get all active SKU-retailer URL mappings."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT sru.*, sc.brand, sc.product_name, sc.pack_size,
-                       rc.name as retailer_name, rc.base_url, rc.selectors
+                SELECT sru.sku_id, sru.retailer_id, sru.product_url
                 FROM sku_retailer_urls sru
                 JOIN sku_config sc ON sru.sku_id = sc.id
                 JOIN retailer_config rc ON sru.retailer_id = rc.id
@@ -246,21 +426,168 @@ class DatabaseManager:
             """)
             return [dict(row) for row in cursor.fetchall()]
             
-    def get_latest_prices(self, days: int = 7) -> List[Dict[str, Any]]:
-        """Get latest prices for all SKUs within specified days."""
+    def count_active_skus(self) -> int:
+        """Count active SKU configurations."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM sku_config WHERE active = 1")
+            return cursor.fetchone()[0]
+
+    def count_active_retailers(self) -> int:
+        """Count active retailer configurations."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM retailer_config WHERE active = 1")
+            return cursor.fetchone()[0]
+
+    def get_price_summary(self, days: int = 7) -> Dict[str, Any]:
+        """Average price, in-stock percentage and distinct product count in one query."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT ph.*, sc.brand, sc.product_name, sc.pack_size,
-                       rc.name as retailer_name
+                SELECT AVG(ph.price) as avg_price,
+                       100.0 * AVG(ph.in_stock) as in_stock_pct,
+                       COUNT(DISTINCT sc.product_name) as unique_products
+                FROM price_history ph
+                JOIN sku_config sc ON ph.sku_id = sc.id
+                WHERE ph.scraped_at >= datetime('now', ?)
+            """, ('-{} days'.format(days),))
+            return dict(cursor.fetchone())
+
+    def get_max_scraped_at(self) -> Optional[str]:
+        """Get the timestamp of the most recent price observation."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT MAX(scraped_at) FROM price_history")
+            return cursor.fetchone()[0]
+
+    def get_distinct_brands(self) -> List[str]:
+        """Get distinct active brand names for filter menus."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT DISTINCT brand FROM sku_config WHERE active = 1 ORDER BY brand")
+            return [row[0] for row in cursor.fetchall()]
+
+    def get_distinct_retailers(self) -> List[str]:
+        """Get distinct active retailer names for filter menus."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT DISTINCT name FROM retailer_config WHERE active = 1 ORDER BY name")
+            return [row[0] for row in cursor.fetchall()]
+
+    def iter_latest_prices(self, days: int = 7,
+                           brands: Optional[List[str]] = None,
+                           retailers: Optional[List[str]] = None,
+                           columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield latest prices for all SKUs within specified days.
+
+        Optional brand/retailer lists are pushed down as parameterized
+        IN clauses so narrow filters never pull the full window into
+        Python; `columns` projects a subset (see PRICE_COLUMN_SQL) so
+        only displayed fields cross the SQLite boundary. Rows stream off
+        the cursor one at a time, so a consumer that stops early (or
+        processes incrementally) never holds the full window in memory.
+        """
+        if columns:
+            unknown = set(columns) - set(self.PRICE_COLUMN_SQL)
+            if unknown:
+                raise ValueError(f"Unknown price columns: {sorted(unknown)}")
+            select = ', '.join(self.PRICE_COLUMN_SQL[column] for column in columns)
+        else:
+            select = "ph.*, sc.brand, sc.product_name, sc.pack_size, rc.name as retailer_name"
+        where = ["ph.scraped_at >= datetime('now', ?)"]
+        params: List[Any] = ['-{} days'.format(days)]
+        if brands:
+            where.append("sc.brand IN ({})".format(','.join('?' * len(brands))))
+            params.extend(brands)
+        if retailers:
+            where.append("rc.name IN ({})".format(','.join('?' * len(retailers))))
+            params.extend(retailers)
+        cursor = self.get_connection().cursor()
+        cursor.execute("""
+            SELECT {}
+            FROM price_history ph
+            JOIN sku_config sc ON ph.sku_id = sc.id
+            JOIN retailer_config rc ON ph.retailer_id = rc.id
+            WHERE {}
+            ORDER BY ph.scraped_at DESC
+        """.format(select, ' AND '.join(where)), params)
+        for row in cursor:
+            yield dict(row)
+
+    def get_latest_prices(self, days: int = 7,
+                          brands: Optional[List[str]] = None,
+                          retailers: Optional[List[str]] = None,
+                          columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get latest prices as a list; see iter_latest_prices to stream."""
+        return list(self.iter_latest_prices(days, brands, retailers, columns))
+            
+    def count_latest_prices(self, days: int = 7) -> int:
+        """Count price observations in the window without fetching rows."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*) FROM price_history
+                WHERE scraped_at >= datetime('now', ?)
+            """, ('-{} days'.format(days),))
+            return cursor.fetchone()[0]
+
+    # SQL expression behind each column name callers may project
+    PRICE_COLUMN_SQL = {
+        'brand': 'sc.brand',
+        'product_name': 'sc.product_name',
+        'pack_size': 'sc.pack_size',
+        'retailer_name': 'rc.name as retailer_name',
+        'price': 'ph.price',
+        'in_stock': 'ph.in_stock',
+        'scraped_at': 'ph.scraped_at',
+    }
+
+    def get_latest_prices_columnar(self, days: int = 7,
+                                   columns: Optional[List[str]] = None) -> Dict[str, List[Any]]:
+        """Get latest prices as a dict of column lists.
+
+        Column arrays wrap straight into a DataFrame without the per-row
+        transpose that pd.DataFrame(list_of_dicts) performs. Pass
+        `columns` to project only what the caller displays, trimming the
+        bytes marshalled out of SQLite.
+        """
+        if columns:
+            unknown = set(columns) - set(self.PRICE_COLUMN_SQL)
+            if unknown:
+                raise ValueError(f"Unknown price columns: {sorted(unknown)}")
+            select = ', '.join(self.PRICE_COLUMN_SQL[column] for column in columns)
+        else:
+            select = "ph.*, sc.brand, sc.product_name, sc.pack_size, rc.name as retailer_name"
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT {}
                 FROM price_history ph
                 JOIN sku_config sc ON ph.sku_id = sc.id
                 JOIN retailer_config rc ON ph.retailer_id = rc.id
-                WHERE ph.scraped_at >= datetime('now', '-{} days')
+                WHERE ph.scraped_at >= datetime('now', ?)
                 ORDER BY ph.scraped_at DESC
-            """.format(days))
-            return [dict(row) for row in cursor.fetchall()]
-            
+            """.format(select), ('-{} days'.format(days),))
+            rows = cursor.fetchall()
+            if not rows:
+                return {}
+            columns = [description[0] for description in cursor.description]
+            return dict(zip(columns, map(list, zip(*rows))))
+
+    def get_daily_price_counts(self, days: int = 7) -> List[Tuple[str, int]]:
+        """Per-day price-row counts for the recent activity chart."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT date(scraped_at) as day, COUNT(*) as count
+                FROM price_history
+                WHERE scraped_at >= datetime('now', ?)
+                GROUP BY day
+                ORDER BY day
+            """, ('-{} days'.format(days),))
+            return [tuple(row) for row in cursor.fetchall()]
+
     def get_health_summary(self) -> Dict[str, Any]:
         """Get system health summary."""
         with self.get_connection() as conn:
@@ -295,7 +622,8 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT sru.*, sc.brand, sc.product_name, sc.pack_size,
+                SELECT sru.id, sru.sku_id, sru.retailer_id,
+                       sc.brand, sc.product_name, sc.pack_size,
                        rc.name as retailer_name, sru.active as is_active,
                        sru.product_url as url
                 FROM sku_retailer_urls sru
@@ -304,47 +632,61 @@ class DatabaseManager:
                 ORDER BY sru.active DESC, sc.brand, sc.product_name, rc.name
             """)
             return [dict(row) for row in cursor.fetchall()]
-    
+
+    def get_url_summary(self) -> Dict[str, int]:
+        """Total/active URL counts and products covered, in one aggregate."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*) as total_urls,
+                       COALESCE(SUM(active), 0) as active_urls,
+                       COUNT(DISTINCT sku_id) as products_covered
+                FROM sku_retailer_urls
+            """)
+            return dict(cursor.fetchone())
+
     def add_url(self, sku_id: int, retailer_id: int, url: str, is_active: bool = True) -> bool:
-        """Add a new SKU-retailer URL mapping."""
+        """Add or update a SKU-retailer URL mapping with one native upsert."""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Check if this SKU-retailer combination already exists (including inactive ones)
                 cursor.execute("""
-                    SELECT id, active, product_url FROM sku_retailer_urls
-                    WHERE sku_id = ? AND retailer_id = ?
-                """, (sku_id, retailer_id))
-                existing = cursor.fetchone()
-                
-                if existing:
-                    # Update existing record
-                    cursor.execute("""
-                        UPDATE sku_retailer_urls
-                        SET product_url = ?, active = ?, updated_at = datetime('now')
-                        WHERE sku_id = ? AND retailer_id = ?
-                    """, (url, 1 if is_active else 0, sku_id, retailer_id))
-                    print(f"Updated existing URL mapping (was active: {existing[1]})")
-                else:
-                    # Insert new record
-                    cursor.execute("""
-                        INSERT INTO sku_retailer_urls
-                        (sku_id, retailer_id, product_url, active, created_at, updated_at)
-                        VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))
-                    """, (sku_id, retailer_id, url, 1 if is_active else 0))
-                    print(f"Inserted new URL mapping")
-                
+                    INSERT INTO sku_retailer_urls
+                    (sku_id, retailer_id, product_url, active, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))
+                    ON CONFLICT(sku_id, retailer_id) DO UPDATE SET
+                        product_url = excluded.product_url,
+                        active = excluded.active,
+                        updated_at = datetime('now')
+                """, (sku_id, retailer_id, url, 1 if is_active else 0))
                 conn.commit()
                 return True
         except Exception as e:
             print(f"Error adding URL: {e}")
-            # Provide more specific error information
-            if "UNIQUE constraint failed" in str(e):
-                raise Exception(f"This product-retailer combination already exists in the database")
-            else:
-                raise Exception(f"Database error: {str(e)}")
+            raise Exception(f"Database error: {str(e)}")
     
+    def add_urls_bulk(self, rows: List[Tuple[int, int, str]]) -> int:
+        """Add or update many SKU-retailer URL mappings in one transaction.
+
+        Each row is (sku_id, retailer_id, url). Existing mappings are
+        upserted in place so a re-pasted batch is idempotent.
+        """
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO sku_retailer_urls
+                (sku_id, retailer_id, product_url, active, created_at, updated_at)
+                VALUES (?, ?, ?, 1, datetime('now'), datetime('now'))
+                ON CONFLICT(sku_id, retailer_id) DO UPDATE SET
+                    product_url = excluded.product_url,
+                    active = 1,
+                    updated_at = datetime('now')
+            """, rows)
+            conn.commit()
+            return cursor.rowcount
+
     def update_url(self, sku_id: int, retailer_id: int, url: str, is_active: bool = True) -> bool:
         """Update an existing SKU-retailer URL mapping."""
         try:
@@ -462,19 +804,44 @@ class DatabaseManager:
             logger.error(f"Error updating schedule run times: {e}")
             return False
     
-    def save_price_data(self, sku_id: int, retailer_id: int, price: float, 
-                       currency: str = 'GBP', in_stock: bool = True, 
-                       availability_text: str = None, product_title: str = None,
-                       raw_data: str = None) -> int:
-        """Save scraped price data to the database."""
+    def bulk_save_price_data(self, rows: List[Tuple[Any, ...]]) -> int:
+        """Insert many price rows with one executemany/commit.
+
+        Each row is (sku_id, retailer_id, price, currency, in_stock,
+        availability_text, product_title, raw_data).
+        """
+        if not rows:
+            return 0
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
+            cursor.executemany("""
                 INSERT INTO price_history 
                 (sku_id, retailer_id, price, currency, in_stock, availability_text, 
                  product_title, raw_data, scraped_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-            """, (sku_id, retailer_id, price, currency, in_stock, 
-                  availability_text, product_title, raw_data))
-            return cursor.lastrowid
-            return False
\ No newline at end of file
+            """, rows)
+            conn.commit()
+            return cursor.rowcount
+
+    def save_price_data(self, sku_id: int, retailer_id: int, price: float,
+                       currency: str = 'GBP', in_stock: bool = True,
+                       availability_text: str = None, product_title: str = None,
+                       raw_data: str = None) -> None:
+        """Buffer one scraped price row; flushed in batches of 500.
+
+        Rows accumulate in memory and are written with one executemany
+        when the batch fills; call flush_prices() at the end of a scrape
+        cycle to persist any remainder.
+        """
+        self._price_batch.append((sku_id, retailer_id, price, currency, in_stock,
+                                  availability_text, product_title, raw_data))
+        if len(self._price_batch) >= 500:
+            self.flush_prices()
+
+    def flush_prices(self) -> int:
+        """Write any buffered price rows in one transaction."""
+        if not self._price_batch:
+            return 0
+        written = self.bulk_save_price_data(self._price_batch)
+        self._price_batch.clear()
+        return written
\ No newline at end of file
@@ -93,8 +93,9 @@ class PriceTrackerOrchestrator:
             is_valid, cleaned_data = self.price_validator.validate_price_data(result)
             
             if is_valid and cleaned_data['success']:
-                # Store price data
-                price_id = self.db_manager.insert_price_data(
+                # Buffer price data; run_full_scrape flushes the batch at
+                # the end of the cycle (or every 500 rows in between)
+                self.db_manager.save_price_data(
                     sku_id=sku_data['id'],
                     retailer_id=retailer_config['id'],
                     price=cleaned_data['price'],
@@ -118,7 +119,6 @@ class PriceTrackerOrchestrator:
                     status='success',
                     response_time=cleaned_data.get('response_time'),
                     additional_data={
-                        'price_id': price_id,
                         'price': cleaned_data['price'],
                         'anomalies': anomalies
                     }
@@ -225,6 +225,11 @@ class PriceTrackerOrchestrator:
             'average_time_per_scrape': round(total_time / len(results), 2) if results else 0
         }
         
+        # Persist any price rows still sitting in the write buffer, then
+        # fold the cycle's rows into the daily rollup the Trends page reads
+        self.db_manager.flush_prices()
+        self.db_manager.refresh_daily_rollup()
+
         logger.info(f"Scrape cycle completed: {summary}")
         
         # Record health metrics
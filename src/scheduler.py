@@ -49,7 +49,10 @@ class PriceTrackerScheduler:
             
             summary = loop.run_until_complete(self.orchestrator.run_full_scrape())
             self.last_scrape_time = datetime.now()
-            
+
+            # Keep the daily rollup in step with the fresh scrape
+            self.orchestrator.db_manager.refresh_daily_rollup()
+
             logger.info(f"Daily scrape completed: {summary}")
             
             # Send notifications if configured
@@ -172,7 +175,10 @@ class PriceTrackerScheduler:
             
             summary = loop.run_until_complete(self.orchestrator.run_full_scrape())
             self.last_scrape_time = datetime.now()
-            
+
+            # Keep the daily rollup in step with the fresh scrape
+            self.orchestrator.db_manager.refresh_daily_rollup()
+
             return summary
             
         except Exception as e:
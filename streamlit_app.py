@@ -16,8 +16,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Add the src directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Add the src directory to the Python path (once; reruns hit the cached entry)
+_SRC_DIR = os.path.join(os.path.dirname(__file__), 'src')
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 # Initialize database and components
 try: